@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Database Migration: Add series stats indexes
+============================================
+
+This script adds the indexes declared on the Book and Reading models to an
+existing database. New databases get them from Base.metadata.create_all.
+
+- idx_read_book_finished on read(book_id, date_finished_actual)
+- idx_books_series on books(series), for books that have a series
+
+Usage:
+    python scripts/database/add_series_stats_indexes.py
+
+The script is safe to re-run; indexes that already exist are left alone.
+"""
+
+import sys
+from pathlib import Path
+from rich.console import Console
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from reading_list.models.base import engine
+from reading_list.models.book import Book
+from reading_list.models.reading import Reading
+
+console = Console()
+
+def main():
+    """Main migration function"""
+    console.print("[bold cyan]Database Migration: Adding series stats indexes[/bold cyan]")
+    console.print()
+
+    try:
+        for model in (Book, Reading):
+            for index in model.__table__.indexes:
+                index.create(bind=engine, checkfirst=True)
+                console.print(f"[green]✓ {index.name} on {model.__tablename__}[/green]")
+    except Exception as e:
+        console.print(f"\n[red]✗ Migration failed: {e}[/red]")
+        return 1
+
+    console.print("\n[bold green]✓ Migration completed successfully![/bold green]")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
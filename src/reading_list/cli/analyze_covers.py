@@ -14,11 +14,16 @@ def add_subparser(subparsers):
         help="Analyze book cover image quality",
         description="Analyze book cover images and identify low-quality covers"
     )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Skip reading dimensions of covers already below the minimum file size"
+    )
     return parser
 
 def handle_command(args):
     """Handle the analyze-covers command."""
-    low_quality_ids = analyze_book_covers()
+    low_quality_ids = analyze_book_covers(include_details=not args.quick)
     
     if low_quality_ids:
         if Confirm.ask("\nWould you like to fetch new covers for these books?"):
@@ -1,5 +1,6 @@
 """CLI command for sending email reading reports."""
 import argparse
+import logging
 from ..services.email_report import EmailReport
 
 def add_subparser(subparsers):
@@ -18,6 +19,11 @@ Examples:
 
 def handle_command(args):
     """Handle the email-report command."""
+    # Surface the report service's progress/errors; debug stays hidden unless asked for
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     report = EmailReport()
-    success = report.send_reading_status()
+    try:
+        success = report.send_reading_status()
+    finally:
+        report.close()
     return 0 if success else 1
\ No newline at end of file
@@ -2,7 +2,7 @@
 import argparse
 from rich.console import Console
 from ..models.base import SessionLocal  # Change this import
-from ..services.image_fetcher import download_book_cover
+from ..services.image_fetcher import download_book_covers
 
 console = Console()
 
@@ -35,12 +35,10 @@ def handle_command(args):
     """Handle the fetch-cover command."""
     try:
         with SessionLocal() as session:  # Use SessionLocal directly
-            success_count = 0
-            for book_id in args.book_ids:
-                if download_book_cover(session, book_id):
-                    success_count += 1
+            results = download_book_covers(session, args.book_ids)
+            success_count = sum(results.values())
             
-            total = len(args.book_ids)
+            total = len(results)
             if success_count == total:
                 console.print(f"[green]Successfully fetched all {total} covers![/green]")
                 return 0
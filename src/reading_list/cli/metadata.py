@@ -52,20 +52,20 @@ Examples:
                        help='Only update entries that are missing the requested metadata')
     parser.add_argument('--concurrent-requests', type=int, default=10,
                        help='Maximum number of concurrent API requests')
-    parser.add_argument('--workers', type=int, default=4,
-                       help='Number of worker threads for file operations')
+    # No longer used (file work runs on the event loop); still accepted so existing scripts keep working
+    parser.add_argument('--workers', type=int, default=4, help=argparse.SUPPRESS)
     
     return parser
 
 def handle_command(args):
     """Handle the metadata command."""
+    fetcher = None
     try:
         fetcher = MetadataFetcher(
             force_update=args.force_update,
             missing_only=args.missing_only
         )
         fetcher.max_concurrent_requests = args.concurrent_requests
-        fetcher.max_workers = args.workers
 
         if args.all:
             fetcher.fetch_all_metadata()
@@ -91,3 +91,6 @@ def handle_command(args):
     except Exception as e:
         console.print(f"[red]Error: {str(e)}[/red]")
         return 1
+    finally:
+        if fetcher is not None:
+            fetcher.close()
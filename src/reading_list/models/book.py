@@ -1,9 +1,14 @@
-from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, VARCHAR, Float
+from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, VARCHAR, Float, Index, func, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from .base import Base
 
 class Book(Base):
     __tablename__ = 'books'
+    __table_args__ = (
+        # Series stats groups by series and only ever looks at books that have one
+        Index('idx_books_series', 'series', sqlite_where=text('series IS NOT NULL')),
+    )
 
     id = Column(Integer, primary_key=True)
     title = Column(VARCHAR, nullable=False)
@@ -23,5 +28,16 @@ class Book(Base):
     readings = relationship("Reading", back_populates="book")
     inventory = relationship("Inventory", back_populates="book")
 
+    @hybrid_property
+    def full_author(self):
+        """First and second author names joined, e.g. for API searches."""
+        return f"{self.author_name_first or ''} {self.author_name_second or ''}".strip()
+
+    @full_author.expression
+    def full_author(cls):
+        return func.trim(
+            func.coalesce(cls.author_name_first, '') + ' ' + func.coalesce(cls.author_name_second, '')
+        )
+
     def __repr__(self):
         return f"<Book(id={self.id}, title='{self.title}')>"
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from .base import Base
 
 class Reading(Base):
     __tablename__ = 'read'
+    __table_args__ = (
+        # Series stats joins reads to books and filters on whether they are finished
+        Index('idx_read_book_finished', 'book_id', 'date_finished_actual'),
+    )
 
     id = Column(Integer, primary_key=True)
     id_previous = Column(Integer)
@@ -1,6 +1,6 @@
 """Models for tracking reading status and progress."""
 from datetime import date, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from .base import engine
 from .reading import Reading
@@ -32,10 +32,19 @@ class ReadingStatus:
         readings = self.repository.get_upcoming_readings()
         return self._sort_readings(readings)
 
-    def get_forecast_readings(self, days: int = 7) -> List[Reading]:
-        """Get readings for forecast with standard sorting."""
-        current_readings = self.get_current_readings()
-        upcoming_readings = [r for r in self.get_upcoming_readings()
+    def get_forecast_readings(self, days: int = 7,
+                              current_readings: Optional[List[Reading]] = None,
+                              upcoming_readings: Optional[List[Reading]] = None) -> List[Reading]:
+        """Get readings for forecast with standard sorting.
+
+        Callers that already fetched the current/upcoming lists can pass them
+        in to avoid querying them a second time.
+        """
+        if current_readings is None:
+            current_readings = self.get_current_readings()
+        if upcoming_readings is None:
+            upcoming_readings = self.get_upcoming_readings()
+        upcoming_readings = [r for r in upcoming_readings
                             if r.date_est_start and r.date_est_start <= date.today() + timedelta(days=days)]
 
         all_readings = current_readings + upcoming_readings
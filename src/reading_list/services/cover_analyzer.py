@@ -1,13 +1,36 @@
 """Service for analyzing book cover image quality."""
+import hashlib
+import io
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, NamedTuple
-from PIL import Image
+from typing import List, Dict, NamedTuple, Optional, Tuple, Union
+import imagesize
+from PIL import Image, features
 from rich.console import Console
 from rich.table import Table
 from sqlalchemy import text
 from ..models.base import engine
 from ..utils.paths import get_project_paths
 
+# Pillow-SIMD builds (and most current Pillow wheels) decode JPEGs through libjpeg-turbo
+LIBJPEG_TURBO = features.check_feature('libjpeg_turbo')
+_slow_jpeg_hinted = False
+
+_JPEG_EXTS = frozenset({'.jpg', '.jpeg', '.JPG', '.JPEG'})
+
+# Above this many covers, header parsing and hashing is farmed out to a process pool
+_PROCESS_POOL_THRESHOLD = 500
+
+_PLACEHOLDER_REASON = "placeholder cover image"
+
+# Real covers almost always differ from the placeholder within the first block
+_PLACEHOLDER_HEAD_BYTES = 4096
+
 class CoverQuality(NamedTuple):
     book_id: int
     filename: str
@@ -23,6 +46,166 @@ class MissingCover(NamedTuple):
     title: str
     author: str
 
+class CoverSettings(NamedTuple):
+    """Quality thresholds passed to cover analysis workers."""
+    min_width: int
+    min_height: int
+    min_file_size_kb: float
+    min_aspect_ratio: float
+    max_aspect_ratio: float
+    placeholder_head: Optional[bytes]
+    placeholder_digest: Optional[bytes]
+    include_details: bool = True
+
+def matches_placeholder(file_path: Union[str, Path],
+                        placeholder_head: Optional[bytes],
+                        placeholder_digest: Optional[bytes]) -> bool:
+    """Compare a file against the placeholder, hashing only when the first block matches."""
+    if placeholder_digest is None:
+        return False
+
+    with open(file_path, 'rb') as f:
+        head = f.read(_PLACEHOLDER_HEAD_BYTES)
+        if head != placeholder_head:
+            return False
+        hasher = hashlib.blake2b(head)
+        hasher.update(f.read())
+    return hasher.digest() == placeholder_digest
+
+def image_dimensions(file_path: Union[str, Path]) -> Tuple[int, int]:
+    """Read image width/height from the file header without decoding pixels."""
+    width, height = imagesize.get(str(file_path))
+    if width <= 0 or height <= 0:
+        # Header format imagesize doesn't understand - let PIL handle it
+        with Image.open(file_path) as img:
+            width, height = img.size
+    return width, height
+
+def analyze_cover_file(cover: Tuple[int, str, str, int, Optional[Tuple[int, int]]],
+                       settings: CoverSettings) -> Tuple[Optional[CoverQuality], Optional[str]]:
+    """Analyze one cover file.
+
+    Kept at module level so it can be pickled into a process pool. Takes a
+    (book_id, filename, path, size_bytes, cached_dimensions) tuple and
+    returns (quality, error).
+    """
+    book_id, filename, path, size_bytes, cached_dimensions = cover
+    try:
+        # Check if it's a placeholder image
+        if matches_placeholder(path, settings.placeholder_head, settings.placeholder_digest):
+            return CoverQuality(
+                book_id=book_id,
+                filename=filename,
+                width=265,  # Known placeholder dimensions
+                height=400,
+                aspect_ratio=0.66,
+                file_size_kb=18.5,
+                is_high_quality=True,  # Don't mark as low quality
+                reason=_PLACEHOLDER_REASON
+            ), None
+
+        # Get file size in KB
+        file_size_kb = size_bytes / 1024
+
+        # Too-small files are low quality regardless of dimensions; skip the
+        # header read when the caller only needs the low-quality verdict
+        if not settings.include_details and file_size_kb < settings.min_file_size_kb:
+            return CoverQuality(
+                book_id=book_id,
+                filename=filename,
+                width=0,
+                height=0,
+                aspect_ratio=0.0,
+                file_size_kb=file_size_kb,
+                is_high_quality=False,
+                reason=f"file size ({file_size_kb:.1f}KB < {settings.min_file_size_kb}KB)"
+            ), None
+
+        # Get image dimensions, unless the cache already has them for this file version
+        width, height = cached_dimensions or image_dimensions(path)
+
+        # Calculate aspect ratio (width/height)
+        aspect_ratio = width / height
+
+        # Determine quality and reason
+        is_high_quality = True
+        reasons = []
+
+        if width < settings.min_width:
+            is_high_quality = False
+            reasons.append(f"width ({width}px < {settings.min_width}px)")
+
+        if height < settings.min_height:
+            is_high_quality = False
+            reasons.append(f"height ({height}px < {settings.min_height}px)")
+
+        if file_size_kb < settings.min_file_size_kb:
+            is_high_quality = False
+            reasons.append(f"file size ({file_size_kb:.1f}KB < {settings.min_file_size_kb}KB)")
+
+        if aspect_ratio > settings.max_aspect_ratio:
+            is_high_quality = False
+            reasons.append(f"too wide ({aspect_ratio:.2f} > {settings.max_aspect_ratio})")
+        elif aspect_ratio < settings.min_aspect_ratio:
+            is_high_quality = False
+            reasons.append(f"too narrow ({aspect_ratio:.2f} < {settings.min_aspect_ratio})")
+        elif abs(aspect_ratio - 1.0) < 0.1:  # Check if close to square
+            is_high_quality = False
+            reasons.append(f"too square (ratio {aspect_ratio:.2f})")
+
+        reason = " and ".join(reasons) if reasons else "meets quality standards"
+
+        return CoverQuality(
+            book_id=book_id,
+            filename=filename,
+            width=width,
+            height=height,
+            aspect_ratio=aspect_ratio,
+            file_size_kb=file_size_kb,
+            is_high_quality=is_high_quality,
+            reason=reason
+        ), None
+
+    except Exception as e:
+        return None, str(e)
+
+class CoverDimensionCache:
+    """On-disk cache of cover dimensions keyed by path, mtime and size."""
+
+    def __init__(self, cache_path: Path):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(cache_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS covers (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER,
+                size INTEGER,
+                width INTEGER,
+                height INTEGER
+            )
+        """)
+
+    def get(self, path: str, mtime_ns: int, size: int) -> Optional[Tuple[int, int]]:
+        """Return cached (width, height) if the file hasn't changed since it was cached."""
+        row = self.conn.execute(
+            "SELECT mtime_ns, size, width, height FROM covers WHERE path = ?", (path,)
+        ).fetchone()
+        if row and row[0] == mtime_ns and row[1] == size:
+            return row[2], row[3]
+        return None
+
+    def put_many(self, rows: List[Tuple[str, int, int, int, int]]):
+        """Store (path, mtime_ns, size, width, height) rows."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO covers (path, mtime_ns, size, width, height) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def close(self):
+        self.conn.close()
+
 class CoverAnalyzer:
     def __init__(self, 
                  min_width: int = 250,
@@ -33,27 +216,55 @@ class CoverAnalyzer:
         self.console = Console()
         self.project_paths = get_project_paths()
         self.covers_path = self.project_paths['assets'] / 'book_covers'
+        self.cache_path = self.project_paths['cache'] / 'covers_cache.sqlite'
         self.min_width = min_width
         self.min_height = min_height
         self.min_file_size_kb = min_file_size_kb
         self.min_aspect_ratio = min_aspect_ratio
         self.max_aspect_ratio = max_aspect_ratio
+        self._hint_without_libjpeg_turbo()
         
-        # Load placeholder image hash
+        # Load placeholder image digest (blake2b, so it is stable across worker processes)
         placeholder_path = self.covers_path / "0.jpg"
         if placeholder_path.exists():
-            with open(placeholder_path, 'rb') as f:
-                self.placeholder_hash = hash(f.read())
+            placeholder_bytes = placeholder_path.read_bytes()
+            self.placeholder_head = placeholder_bytes[:_PLACEHOLDER_HEAD_BYTES]
+            self.placeholder_digest = hashlib.blake2b(placeholder_bytes).digest()
         else:
-            self.placeholder_hash = None
+            self.placeholder_head = None
+            self.placeholder_digest = None
+
+    def _hint_without_libjpeg_turbo(self):
+        """Suggest Pillow-SIMD once per process when Pillow was built without libjpeg-turbo."""
+        global _slow_jpeg_hinted
+        if LIBJPEG_TURBO or _slow_jpeg_hinted:
+            return
+        _slow_jpeg_hinted = True
+        self.console.print(
+            "[dim yellow]Pillow was built without libjpeg-turbo; installing the 'fast' extra "
+            "(pip install 'reading_list\\[fast]', which uses Pillow-SIMD) speeds up cover processing.[/dim yellow]"
+        )
 
-    def is_placeholder_image(self, file_path: Path) -> bool:
+    def is_placeholder_image(self, file_path: Union[str, Path]) -> bool:
         """Check if the given file is identical to the placeholder image."""
-        if self.placeholder_hash is None:
-            return False
-            
-        with open(file_path, 'rb') as f:
-            return hash(f.read()) == self.placeholder_hash
+        return matches_placeholder(file_path, self.placeholder_head, self.placeholder_digest)
+
+    def get_image_dimensions(self, file_path: Union[str, Path]) -> Tuple[int, int]:
+        """Read image width/height from the file header without decoding pixels."""
+        return image_dimensions(file_path)
+
+    def get_settings(self, include_details: bool = True) -> CoverSettings:
+        """Bundle the quality thresholds for the analysis workers."""
+        return CoverSettings(
+            min_width=self.min_width,
+            min_height=self.min_height,
+            min_file_size_kb=self.min_file_size_kb,
+            min_aspect_ratio=self.min_aspect_ratio,
+            max_aspect_ratio=self.max_aspect_ratio,
+            placeholder_head=self.placeholder_head,
+            placeholder_digest=self.placeholder_digest,
+            include_details=include_details
+        )
 
     def get_missing_covers(self) -> List[MissingCover]:
         """Get list of books that are missing covers."""
@@ -77,91 +288,80 @@ class CoverAnalyzer:
             """))
             return [MissingCover(row[0], row[1], row[2]) for row in result]
 
-    def analyze_covers(self) -> List[CoverQuality]:
-        """Analyze all book covers and return quality information."""
+    def analyze_covers(self, include_details: bool = True) -> List[CoverQuality]:
+        """Analyze all book covers and return quality information.
+
+        With include_details=False, covers below the minimum file size are
+        reported without reading their dimensions.
+        """
         results = []
         placeholder_covers = []
-        
-        for cover_file in self.covers_path.glob('*.jp*g'):
-            try:
-                # Extract book ID from filename
-                book_id = int(cover_file.stem)
-                
-                # Skip fallback image (cover 0)
-                if book_id == 0:
+        covers = []
+        stats = {}
+        cache = CoverDimensionCache(self.cache_path)
+
+        try:
+            for entry in os.scandir(self.covers_path):
+                stem, ext = os.path.splitext(entry.name)
+                if ext not in _JPEG_EXTS:
                     continue
-                
-                # Check if it's a placeholder image
-                if self.is_placeholder_image(cover_file):
-                    placeholder_covers.append(book_id)
-                    results.append(CoverQuality(
-                        book_id=book_id,
-                        filename=cover_file.name,
-                        width=265,  # Known placeholder dimensions
-                        height=400,
-                        aspect_ratio=0.66,
-                        file_size_kb=18.5,
-                        is_high_quality=True,  # Don't mark as low quality
-                        reason="placeholder cover image"
-                    ))
+                try:
+                    # Extract book ID from filename
+                    book_id = int(stem)
+
+                    # Skip fallback image (cover 0)
+                    if book_id == 0:
+                        continue
+
+                    # DirEntry caches the stat result from the directory scan
+                    st = entry.stat()
+                    stats[entry.path] = (st.st_mtime_ns, st.st_size)
+                    cached = cache.get(entry.path, st.st_mtime_ns, st.st_size)
+                    covers.append((book_id, entry.name, entry.path, st.st_size, cached))
+                except Exception as e:
+                    self.console.print(f"[red]Error analyzing {entry.path}: {str(e)}[/red]")
+
+            analyze = partial(analyze_cover_file, settings=self.get_settings(include_details))
+            if len(covers) > _PROCESS_POOL_THRESHOLD:
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    outcomes = list(executor.map(analyze, covers, chunksize=32))
+            else:
+                outcomes = map(analyze, covers)
+
+            new_entries = []
+            for cover, (quality, error) in zip(covers, outcomes):
+                if error is not None:
+                    self.console.print(f"[red]Error analyzing {cover[2]}: {error}[/red]")
                     continue
-                
-                # Get file size in KB
-                file_size_kb = cover_file.stat().st_size / 1024
-                
-                # Get image dimensions
-                with Image.open(cover_file) as img:
-                    width, height = img.size
-                
-                # Calculate aspect ratio (width/height)
-                aspect_ratio = width / height
-                
-                # Determine quality and reason
-                is_high_quality = True
-                reasons = []
-                
-                if width < self.min_width:
-                    is_high_quality = False
-                    reasons.append(f"width ({width}px < {self.min_width}px)")
-                
-                if height < self.min_height:
-                    is_high_quality = False
-                    reasons.append(f"height ({height}px < {self.min_height}px)")
-                
-                if file_size_kb < self.min_file_size_kb:
-                    is_high_quality = False
-                    reasons.append(f"file size ({file_size_kb:.1f}KB < {self.min_file_size_kb}KB)")
-                
-                if aspect_ratio > self.max_aspect_ratio:
-                    is_high_quality = False
-                    reasons.append(f"too wide ({aspect_ratio:.2f} > {self.max_aspect_ratio})")
-                elif aspect_ratio < self.min_aspect_ratio:
-                    is_high_quality = False
-                    reasons.append(f"too narrow ({aspect_ratio:.2f} < {self.min_aspect_ratio})")
-                elif abs(aspect_ratio - 1.0) < 0.1:  # Check if close to square
-                    is_high_quality = False
-                    reasons.append(f"too square (ratio {aspect_ratio:.2f})")
-                
-                reason = " and ".join(reasons) if reasons else "meets quality standards"
-                
-                results.append(CoverQuality(
-                    book_id=book_id,
-                    filename=cover_file.name,
-                    width=width,
-                    height=height,
-                    aspect_ratio=aspect_ratio,
-                    file_size_kb=file_size_kb,
-                    is_high_quality=is_high_quality,
-                    reason=reason
-                ))
-                
-            except Exception as e:
-                self.console.print(f"[red]Error analyzing {cover_file}: {str(e)}[/red]")
+                if quality.reason == _PLACEHOLDER_REASON:
+                    placeholder_covers.append(quality.book_id)
+                elif cover[4] is None and quality.width > 0:
+                    mtime_ns, size = stats[cover[2]]
+                    new_entries.append((cover[2], mtime_ns, size, quality.width, quality.height))
+                results.append(quality)
+
+            if new_entries:
+                cache.put_many(new_entries)
+        finally:
+            cache.close()
         
         if placeholder_covers:
             self.console.print(f"\n[yellow]Warning: Found {len(placeholder_covers)} placeholder covers: {', '.join(map(str, sorted(placeholder_covers)))}[/yellow]")
         
-        return sorted(results, key=lambda x: (x.is_high_quality, x.book_id))
+        return sorted(results, key=attrgetter('is_high_quality', 'book_id'))
+
+    def _print_table(self, table: Table):
+        """Render a table off-screen in one pass, then write it to stdout at once."""
+        buf = io.StringIO()
+        Console(
+            file=buf,
+            width=self.console.width,
+            force_terminal=self.console.is_terminal,
+            color_system=self.console.color_system,
+            legacy_windows=False
+        ).print(table)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
     def print_analysis(self, results: List[CoverQuality]):
         """Print analysis results in a formatted table."""
@@ -189,7 +389,7 @@ class CoverAnalyzer:
                     result.reason
                 )
             
-            self.console.print(table)
+            self._print_table(table)
             
             # Print summary of existing covers
             low_quality = [r for r in results if not r.is_high_quality]
@@ -211,13 +411,13 @@ class CoverAnalyzer:
                     missing.author
                 )
             
-            self.console.print(missing_table)
+            self._print_table(missing_table)
             self.console.print(f"\n[red]Found {len(missing_covers)} books missing covers.[/red]")
         
         return [r.book_id for r in results if not r.is_high_quality] + [m.book_id for m in missing_covers]
 
-def analyze_book_covers():
+def analyze_book_covers(include_details: bool = True):
     """CLI entry point for cover analysis."""
     analyzer = CoverAnalyzer()
-    results = analyzer.analyze_covers()
+    results = analyzer.analyze_covers(include_details=include_details)
     return analyzer.print_analysis(results)
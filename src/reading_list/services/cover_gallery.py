@@ -1,82 +1,35 @@
 """Service for generating book cover gallery."""
+import os
+import tempfile
 from pathlib import Path
 from datetime import datetime
-from jinja2 import Template
+from markupsafe import escape
 from rich.console import Console
 from sqlalchemy import text
 
 from ..models.base import engine
 from ..utils.paths import get_project_paths
 
-class CoverGalleryGenerator:
-    def __init__(self):
-        self.console = Console()
-        self.paths = get_project_paths()
-        self.covers_path = self.paths['assets'] / 'book_covers'
-        self.output_path = self.paths['reports'] / 'chain' / 'cover_gallery.html'
-        
-        # Create chain reports directory if it doesn't exist
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    def generate(self, debug=False):
-        """Generate an HTML gallery of all book covers."""
-        try:
-            self.console.print("[blue]Generating cover gallery...[/blue]")
-
-            books = []
-            with engine.connect() as conn:
-                result = conn.execute(text("""
-                    SELECT 
-                        b.id,
-                        b.title,
-                        CASE 
-                            WHEN b.author_name_first IS NOT NULL AND b.author_name_second IS NOT NULL 
-                                THEN b.author_name_first || ' ' || b.author_name_second
-                            ELSE COALESCE(b.author_name_first, b.author_name_second, 'Unknown Author')
-                        END as author
-                    FROM books b
-                    WHERE b.cover = TRUE
-                    ORDER BY b.title
-                """))
-                
-                for row in result:
-                    cover_file = None
-                    for ext in ['.jpg', '.jpeg', '.png', '.webp']:
-                        check_path = self.covers_path / f"{row.id}{ext}"
-                        if check_path.exists():
-                            cover_file = f"{row.id}{ext}"
-                            break
-                    
-                    if cover_file:
-                        books.append({
-                            'id': row.id,
-                            'title': row.title,
-                            'author': row.author,
-                            'cover_path': f"/assets/book_covers/{cover_file}"
-                        })
-
-            # Add timestamp for cache busting
-            timestamp = int(datetime.now().timestamp())
+# Supported cover extensions, ranked by preference when a book has several
+_COVER_EXT_RANK = {'.jpg': 0, '.jpeg': 1, '.png': 2, '.webp': 3}
 
-            # Generate HTML
-            html_content = self._get_template().render(
-                books=books,
-                timestamp=timestamp
-            )
-
-            # Write to file
-            with open(self.output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            self.console.print(f"[green]Gallery generated with {len(books)} covers[/green]")
-
-        except Exception as e:
-            self.console.print(f"[red]Error generating gallery: {str(e)}[/red]")
-            raise
+# Built once so SQLAlchemy's compiled cache is keyed on the same statement every run
+_GALLERY_BOOKS_QUERY = text("""
+    SELECT 
+        b.id,
+        b.title,
+        CASE 
+            WHEN b.author_name_first IS NOT NULL AND b.author_name_second IS NOT NULL 
+                THEN b.author_name_first || ' ' || b.author_name_second
+            ELSE COALESCE(b.author_name_first, b.author_name_second, 'Unknown Author')
+        END as author
+    FROM books b
+    WHERE b.cover = TRUE
+    ORDER BY b.title
+""")
 
-    def _get_template(self) -> Template:
-        """Return the Jinja2 template for the gallery."""
-        return Template("""
+# Static page chrome is assembled once; only the stats line and cards vary per run
+_HEAD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -136,34 +89,137 @@ class CoverGalleryGenerator:
             color: #7f8c8d;
         }
     </style>
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            // Add cache buster to all cover images
-            document.querySelectorAll('.cover-img').forEach(img => {
-                const url = new URL(img.src, window.location.href);
-                url.searchParams.set('v', '{{ timestamp }}');
-                img.src = url.href;
-            });
-        });
-    </script>
 </head>
 <body>
     <h1>Book Cover Gallery</h1>
-    <div class="stats">
-        Total Books with Covers: {{ books|length }}
+"""
+
+_STATS_FMT = """    <div class="stats">
+        Total Books with Covers: {count}
     </div>
     <div class="gallery">
-        {% for book in books %}
-        <div class="book-card">
-            <img src="{{ book.cover_path }}" alt="Cover of {{ book.title }}" class="cover-img">
+"""
+
+# The ?v= query string busts browser caches when covers are re-fetched
+_CARD_FMT = """        <div class="book-card">
+            <img src="{cover_path}?v={timestamp}" alt="Cover of {title}" class="cover-img">
             <div class="book-info">
-                <div class="book-title">{{ book.title }}</div>
-                <div class="book-author">{{ book.author }}</div>
-                <div class="book-id">ID: {{ book.id }}</div>
+                <div class="book-title">{title}</div>
+                <div class="book-author">{author}</div>
+                <div class="book-id">ID: {id}</div>
             </div>
         </div>
-        {% endfor %}
-    </div>
+"""
+
+_FOOT_HTML = """    </div>
 </body>
 </html>
-""")
+"""
+
+def _write_all(fd: int, data: bytes):
+    """os.write() until every byte is written (short writes are rare but legal)."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _write_atomic(path: Path, data: bytes):
+    """Write data to path in one os.write() and swap it into place atomically."""
+    directory = str(path.parent)
+    tmp_name = None
+    try:
+        # Linux: anonymous O_TMPFILE inode, linked into the directory once complete
+        fd = os.open(directory, os.O_TMPFILE | os.O_WRONLY, 0o644)
+        try:
+            _write_all(fd, data)
+            tmp_name = os.path.join(directory, f".{path.name}.{os.getpid()}.tmp")
+            os.link(f"/proc/self/fd/{fd}", tmp_name)
+        finally:
+            os.close(fd)
+    except (AttributeError, OSError):
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        # Other platforms / filesystems: named temp file in the same directory
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=f".{path.name}.")
+        try:
+            _write_all(fd, data)
+        finally:
+            os.close(fd)
+        os.chmod(tmp_name, 0o644)
+    os.replace(tmp_name, path)
+
+class CoverGalleryGenerator:
+    def __init__(self):
+        self.console = Console()
+        self.paths = get_project_paths()
+        self.covers_path = self.paths['assets'] / 'book_covers'
+        self.output_path = self.paths['reports'] / 'chain' / 'cover_gallery.html'
+        
+        # Create chain reports directory if it doesn't exist
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def generate(self, debug=False):
+        """Generate an HTML gallery of all book covers."""
+        try:
+            self.console.print("[blue]Generating cover gallery...[/blue]")
+
+            with engine.connect() as conn:
+                books = list(self._iter_books(conn))
+
+            # Add timestamp for cache busting
+            timestamp = int(datetime.now().timestamp())
+
+            # Generate HTML
+            cards = ''.join(
+                _CARD_FMT.format(
+                    id=book['id'],
+                    title=escape(book['title']),
+                    author=escape(book['author']),
+                    cover_path=book['cover_path'],
+                    timestamp=timestamp
+                )
+                for book in books
+            )
+            html_content = _HEAD_HTML + _STATS_FMT.format(count=len(books)) + cards + _FOOT_HTML
+
+            # Write to file
+            _write_atomic(self.output_path, html_content.encode('utf-8'))
+
+            self.console.print(f"[green]Gallery generated with {len(books)} covers[/green]")
+
+        except Exception as e:
+            self.console.print(f"[red]Error generating gallery: {str(e)}[/red]")
+            raise
+
+    def _scan_cover_files(self) -> dict:
+        """Map book IDs to their cover filename with a single directory scan."""
+        cover_by_id = {}
+        best_rank = {}
+        if not self.covers_path.exists():
+            return cover_by_id
+
+        with os.scandir(self.covers_path) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                rank = _COVER_EXT_RANK.get(ext)
+                if rank is None or not stem.isdigit():
+                    continue
+                book_id = int(stem)
+                if rank < best_rank.get(book_id, len(_COVER_EXT_RANK)):
+                    best_rank[book_id] = rank
+                    cover_by_id[book_id] = entry.name
+        return cover_by_id
+
+    def _iter_books(self, conn):
+        """Yield gallery entries for books that have a cover file on disk."""
+        cover_by_id = self._scan_cover_files()
+        result = conn.execute(_GALLERY_BOOKS_QUERY)
+
+        return (
+            {
+                'id': row.id,
+                'title': row.title,
+                'author': row.author,
+                'cover_path': f"/assets/book_covers/{cover_by_id[row.id]}"
+            }
+            for row in result if row.id in cover_by_id
+        )
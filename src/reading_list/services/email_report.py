@@ -1,12 +1,14 @@
 """Service for generating and sending email reading reports."""
+import base64
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, timedelta
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.image import MIMEImage
+from itertools import chain
+from html import escape
 import os
-import smtplib
-import requests
-from typing import Dict, Tuple, List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
 from .status_display import StatusDisplay
@@ -16,125 +18,25 @@ from ..models.reading import Reading
 from ..models.reading_status import ReadingStatus
 from ..utils.progress_calculator import calculate_reading_progress
 
-class EmailReport:
-    """Service for sending email reading reports."""
-
-    def __init__(self):
-        load_dotenv()
-        self.status_display = StatusDisplay()
-        self.sender_email = EMAIL_CONFIG['sender_email']
-        self.receiver_email = EMAIL_CONFIG['receiver_email']
-        self.smtp_server = EMAIL_CONFIG['smtp_server']
-        self.smtp_port = EMAIL_CONFIG['smtp_port']
-        self.templates_dir = EMAIL_CONFIG['templates_dir']
-        self.image_cids: Dict[str, Tuple[str, bytes, str]] = {}
-
-    def _generate_reading_row(self, reading: Reading, is_current: bool = True) -> str:
-        """Generate HTML table row for a reading."""
-        def format_date(d: Optional[date]) -> str:
-            """Format date as 'MMM DD' with ordinal suffix."""
-            if not d:
-                return 'Not scheduled'
-            day = d.day
-            suffix = 'th' if 11 <= day <= 13 else {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
-            return d.strftime(f'%b {day}{suffix}')
-
-        # Get cover image
-        cover_url = self._get_book_cover_url(reading.book.title, reading.book.author_name_first, reading.book.id)
-        cover_cell = f'<td style="padding: 12px;"><img src="{cover_url}" style="width: 60px; border-radius: 4px;" alt="Book cover"/></td>' if cover_url else '<td></td>'
-        
-        # Format dates and progress
-        formatted = {
-            'author': f"{reading.book.author_name_first} {reading.book.author_name_second}",
-            'start_date': (format_date(reading.date_started) if reading.date_started else 
-                          format_date(reading.date_est_start) if reading.date_est_start else 
-                          'Not scheduled'),
-            'end_date': format_date(reading.date_est_end)
-        }
-
-        # Get formatted media badge
-        media_badge = self.status_display._format_media_badge(reading.media)
-
-        # Calculate progress for current readings
-        progress = ''
-        if is_current:
-            today = date.today()
-            progress = calculate_reading_progress(reading, today)
-            if progress and progress.endswith('%'):
-                pct = float(progress.rstrip('%'))
-                total_pages = reading.book.page_count
-                pages_read = int(round((pct / 100) * total_pages)) if total_pages else 0
-                progress = f"p. {pages_read}<br>{pct}%" if total_pages else progress
-
-        return f"""
-            <tr>
-                {cover_cell}
-                <td style="padding: 12px;">{media_badge}</td>
-                <td style="padding: 12px;">
-                    <div style="font-weight: 600;">{reading.book.title}</div>
-                    <div style="color: #64748b; font-size: 14px;">{formatted['author']}</div>
-                </td>
-                {f'<td style="padding: 12px;">{progress}</td>' if is_current else ''}
-                <td style="padding: 12px;">{formatted['start_date']}</td>
-                <td style="padding: 12px;">{formatted['end_date']}</td>
-            </tr>
-        """
-
-    def _generate_html_table(self, readings: List[Reading], title: str, is_current: bool = True) -> str:
-        """Generate HTML table for readings."""
-        if not readings:
-            return f"<h2>{title}</h2><p>No readings found.</p>"
-
-        headers = ['Cover', 'Format', 'Book']
-        if is_current:
-            headers.append('Progress')
-        headers.extend(['Start Date', 'End Date'])
-
-        header_row = "".join([f'<th style="text-align: left; padding: 12px; background-color: #f8fafc;">{h}</th>' for h in headers])
+if TYPE_CHECKING:
+    import smtplib
 
-        rows = [self._generate_reading_row(reading, is_current) for reading in readings]
+logger = logging.getLogger(__name__)
 
-        return f"""
-            <div style="margin-bottom: 32px;">
-                <h2 style="color: #1e293b; margin-bottom: 16px;">{title}</h2>
-                <table style="width: 100%; border-collapse: collapse; background-color: white; border-radius: 8px; overflow: hidden; box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.1);">
-                    <thead>
-                        <tr>{header_row}</tr>
-                    </thead>
-                    <tbody>
-                        {"".join(rows)}
-                    </tbody>
-                </table>
-            </div>
-        """
-
-    def _generate_html_content(self, current_readings: List[Reading], upcoming_readings: List[Reading]) -> str:
-        """Generate complete HTML email content."""
-        # Use the model's standardized sorted lists
-        model = ReadingStatus()
-        current_readings = model.get_current_readings()
-        upcoming_readings = model.get_upcoming_readings()
-        all_readings = model.get_forecast_readings()
-
-        current_table = self._generate_html_table(current_readings, "Currently Reading", True)
-        upcoming_table = self._generate_html_table(upcoming_readings, "Coming Soon", False)
-        forecast_table = self._generate_forecast_table(all_readings)
-
-        today_date = date.today().strftime('%B %-d')  # Format like "March 5"
-
-        return f"""
+# Static page chrome; only the date, tables and rows are filled in per email
+_PAGE_PREFIX = """
         <html>
             <head>
                 <style>
                     @import url('https://fonts.googleapis.com/css2?family=Outfit:wght@400;500;600;700;800&display=swap');
-                    body {{
+                    body {
                         font-family: 'Outfit', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
                         margin: 0;
                         padding: 24px;
                         background-color: #f1f5f9;
                         color: #1e293b;
                         line-height: 1.5;
-                    }}
+                    }
                 </style>
             </head>
             <body>
@@ -176,54 +78,65 @@ class EmailReport:
                             margin: 0 auto;
                             font-weight: 500;
                         ">
-                            Here's your personalized reading dashboard for {today_date}!<br>
+                            Here's your personalized reading dashboard for """
+
+_PAGE_INTRO_END = """!<br>
                             Below you'll find your current reading progress, upcoming books in your queue,
                             and a forecast of your reading journey for the next 7 days. Keep turning those pages! 📚
                         </p>
                     </div>
 
-                    {current_table}
-                    {upcoming_table}
-                    {forecast_table}
+                    """
+
+_PAGE_SUFFIX = """
                 </div>
             </body>
         </html>
         """
 
-    def _format_forecast_cell(self, progress: str) -> str:
-        """Format forecast cell content for email HTML."""
-        if progress in ["TBR", "Done"]:
-            return f'<span style="color: #94A3B8;">{progress}</span>'  # Soft slate gray
-        
-        # Extract the percentage value from the Rich-formatted string
-        if "%" in progress:
-            try:
-                value = int(progress.split("%")[0])
-                # Smooth gradient from soft pink to soft teal
-                if value < 20:
-                    color = "#F472B6"  # Soft pink
-                elif value < 40:
-                    color = "#818CF8"  # Soft purple
-                elif value < 60:
-                    color = "#38BDF8"  # Light blue
-                elif value < 80:
-                    color = "#22D3EE"  # Cyan
-                else:
-                    color = "#2DD4BF"  # Soft teal
-                return f'<span style="color: {color}; font-weight: 600;">{value}%</span>'
-            except ValueError:
-                return progress
-        
-        return progress
+_TH_STYLE = 'text-align: left; padding: 12px; background-color: #f8fafc;'
 
-    def _generate_forecast_table(self, readings: List[Reading]) -> str:
-        """Generate HTML table for weekly progress forecast."""
-        if not readings:
-            return "<p>No current or upcoming readings found for the next 7 days.</p>"
+def _table_head(headers: List[str]) -> str:
+    """Build the constant <thead> (plus <tbody> opener) for a readings table."""
+    header_row = "".join([f'<th style="{_TH_STYLE}">{h}</th>' for h in headers])
+    return f"""
+                <table style="width: 100%; border-collapse: collapse; background-color: white; border-radius: 8px; overflow: hidden; box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.1);">
+                    <thead>
+                        <tr>{header_row}</tr>
+                    </thead>
+                    <tbody>
+                        """
 
-        dates = [date.today() + timedelta(days=i) for i in range(7)]  # Changed from 8 to 7
+_TABLE_TITLE_OPEN = """
+            <div style="margin-bottom: 32px;">
+                <h2 style="color: #1e293b; margin-bottom: 16px;">"""
+_TABLE_TITLE_CLOSE = "</h2>"
+_TABLE_HEAD_CURRENT = _table_head(['Cover', 'Format', 'Book', 'Progress', 'Start Date', 'End Date'])
+_TABLE_HEAD_UPCOMING = _table_head(['Cover', 'Format', 'Book', 'Start Date', 'End Date'])
+_TABLE_CLOSE = """
+                    </tbody>
+                </table>
+            </div>
+        """
 
-        table = """
+_ROW_TMPL_HEAD = """
+            <tr>
+                {cover_cell}
+                <td style="padding: 12px;">{media_badge}</td>
+                <td style="padding: 12px;">
+                    <div style="font-weight: 600;">{title}</div>
+                    <div style="color: #64748b; font-size: 14px;">{author}</div>
+                </td>"""
+_ROW_TMPL_TAIL = """
+                <td style="padding: 12px;">{start_date}</td>
+                <td style="padding: 12px;">{end_date}</td>
+            </tr>
+        """
+_ROW_TMPL_CURRENT = _ROW_TMPL_HEAD + """
+                <td style="padding: 12px;">{progress}</td>""" + _ROW_TMPL_TAIL
+_ROW_TMPL_UPCOMING = _ROW_TMPL_HEAD + _ROW_TMPL_TAIL
+
+_FORECAST_TABLE_OPEN = """
         <div style="margin-bottom: 32px;">
             <h2 style="color: #1e293b; margin-bottom: 16px;">Weekly Reading Forecast</h2>
             <div style="overflow-x: auto; -webkit-overflow-scrolling: touch;">
@@ -233,42 +146,266 @@ class EmailReport:
                             <th style="text-align: left; padding: 12px; background-color: #f8fafc; min-width: 70px; width: 70px;">Format</th>
                             <th style="text-align: left; padding: 12px; background-color: #f8fafc; min-width: 300px;">Title</th>
         """
+_FORECAST_TABLE_CLOSE = "</tbody></table></div></div>"
+_FORECAST_CELL_OPEN = '<td style="text-align: center; padding: 12px;">'
+_FORECAST_CELL_CLOSE = '</td>'
+_FORECAST_CELL_JOIN = _FORECAST_CELL_CLOSE + _FORECAST_CELL_OPEN
+
+_FORECAST_DAYS = 7
+
+# Forecast progress colors per 20% bucket, soft pink through soft teal
+_FORECAST_COLORS = ('#F472B6', '#818CF8', '#38BDF8', '#22D3EE', '#2DD4BF')
+
+_TBR_CELL = '<span style="color: #94A3B8;">TBR</span>'  # Soft slate gray
+_DONE_CELL = '<span style="color: #94A3B8;">Done</span>'
+_STATUS_CELLS = {'TBR': _TBR_CELL, 'Done': _DONE_CELL}
+
+def _format_pct_cell(value: int) -> str:
+    """Colored forecast percentage span."""
+    color = _FORECAST_COLORS[min(max(value, 0) // 20, 4)]
+    return f'<span style="color: {color}; font-weight: 600;">{value}%</span>'
+
+_ORDINAL_SUFFIX = {1: 'st', 2: 'nd', 3: 'rd'}
+
+# English names, indexed directly instead of going through locale-dependent strftime
+_MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+_MONTH_FULL = ('January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December')
+_DAY_ABBR = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+def _fmt_day_abbr(d: date) -> str:
+    """'Mon' (strftime '%a')."""
+    return _DAY_ABBR[d.weekday()]
+
+def _fmt_month_d(d: date) -> str:
+    """'March 5' (strftime '%B %-d', which isn't portable to Windows)."""
+    return f'{_MONTH_FULL[d.month - 1]} {d.day}'
+
+def _fmt_month_dd(d: date) -> str:
+    """'March 05' (strftime '%B %d')."""
+    return f'{_MONTH_FULL[d.month - 1]} {d.day:02d}'
+
+def _format_date(d: Optional[date]) -> str:
+    """Format date as 'MMM DD' with ordinal suffix."""
+    if not d:
+        return 'Not scheduled'
+    day = d.day
+    suffix = 'th' if 11 <= day <= 13 else _ORDINAL_SUFFIX.get(day % 10, 'th')
+    return f'{_MONTH_ABBR[d.month - 1]} {day}{suffix}'
+
+@dataclass
+class CoverEntry:
+    """Inline cover image attached to the email, with its base64 body pre-encoded."""
+    __slots__ = ('cid', 'data', 'mime', 'encoded')
+    cid: str
+    data: bytes
+    mime: str
+    encoded: str
+
+@dataclass
+class _RowVM:
+    """Per-reading display strings, built once and shared by every table the reading appears in.
+
+    title and author_full are already HTML-escaped.
+    """
+    __slots__ = ('author_full', 'title', 'media_badge', 'start_str', 'end_str',
+                 'cover_cell', 'progress_cell', 'forecast_cells')
+    author_full: str
+    title: str
+    media_badge: str
+    start_str: str
+    end_str: str
+    cover_cell: str
+    progress_cell: str
+    forecast_cells: Tuple[str, ...]
+
+def _load_cover(book_id: int, covers_dir: Path) -> Optional[Tuple[bytes, str]]:
+    """Read a local cover image and its base64 MIME body, or None if it can't be read."""
+    try:
+        data = (covers_dir / f'{book_id}.jpg').read_bytes()
+    except OSError:
+        return None
+    return data, base64.encodebytes(data).decode('ascii')
+
+class EmailReport:
+    """Service for sending email reading reports."""
+
+    def __init__(self):
+        load_dotenv()
+        self.status_display = StatusDisplay()
+        self.sender_email = EMAIL_CONFIG['sender_email']
+        self.receiver_email = EMAIL_CONFIG['receiver_email']
+        self.smtp_server = EMAIL_CONFIG['smtp_server']
+        self.smtp_port = EMAIL_CONFIG['smtp_port']
+        self.templates_dir = EMAIL_CONFIG['templates_dir']
+        # Covers loaded during the current send, shared by every table; reset per send
+        self.image_cids: Dict[int, CoverEntry] = {}
+        self._covers_dir = get_project_paths()['assets'] / 'book_covers'
+        self._cover_ids: set = set()  # Rescanned at the start of each send
+        # Reused for cover file reads on every send; threads start on first use
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+        self._cover_futures: Dict[int, Future] = {}
+        self._status_model: Optional[ReadingStatus] = None
+        self._smtp: Optional['smtplib.SMTP'] = None
+
+    def _build_view_models(self, current_readings: List[Reading], upcoming_readings: List[Reading],
+                           all_readings: List[Reading], today: date) -> Dict[int, _RowVM]:
+        """Walk every reading once, keyed by reading id, for all three tables."""
+        table_ids = {r.id for r in current_readings}
+        current_ids = set(table_ids)
+        table_ids.update(r.id for r in upcoming_readings)
+        forecast_ids = {r.id for r in all_readings}
+        dates = [today + timedelta(days=i) for i in range(_FORECAST_DAYS)]
+
+        vms = {}
+        for reading in chain(current_readings, upcoming_readings, all_readings):
+            if reading.id in vms:
+                continue
+            book = reading.book
+            vms[reading.id] = _RowVM(
+                author_full=escape(f"{book.author_name_first} {book.author_name_second}"),
+                title=escape(book.title),
+                media_badge=self.status_display._format_media_badge(reading.media),
+                start_str=_format_date(reading.date_started or reading.date_est_start),
+                end_str=_format_date(reading.date_est_end),
+                cover_cell=self._cover_cell(book.id) if reading.id in table_ids else '',
+                progress_cell=self._progress_cell(reading, today) if reading.id in current_ids else '',
+                forecast_cells=(
+                    self._forecast_row_cells(reading, dates) if reading.id in forecast_ids else ()
+                ),
+            )
+        return vms
+
+    def _cover_cell(self, book_id: int) -> str:
+        """Cover <td> for the current/upcoming tables."""
+        cover_url = self._get_book_cover_url(book_id)
+        if not cover_url:
+            return '<td></td>'
+        return f'<td style="padding: 12px;"><img src="{cover_url}" style="width: 60px; border-radius: 4px;" alt="Book cover"/></td>'
+
+    def _progress_cell(self, reading: Reading, today: date) -> str:
+        """Progress text for a current reading, with the page estimate when known."""
+        pct = calculate_reading_progress(reading, today, raw_value=True)
+        total_pages = reading.book.page_count
+        if not total_pages:
+            return f"{int(pct)}%"
+        return f"p. {int(round((pct / 100) * total_pages))}<br>{pct}%"
+
+    def _forecast_row_cells(self, reading: Reading, dates: List[date]) -> Tuple[str, ...]:
+        """Formatted forecast cells for each of the consecutive forecast dates.
+
+        Dates before the reading starts are TBR and dates after it ends are
+        Done, so only the days inside that window go through the formatter.
+        """
+        format_progress = self.status_display._format_forecast_progress
+        start_date = reading.date_started or reading.date_est_start
+        if not start_date or not reading.date_est_end:
+            return tuple(
+                self._format_forecast_cell(format_progress(reading, forecast_date, raw_value=True))
+                for forecast_date in dates
+            )
+
+        first = dates[0]
+        start_idx = min(max((start_date - first).days, 0), len(dates))
+        end_idx = max(min((reading.date_est_end - first).days + 1, len(dates)), start_idx)
+        return (
+            (_TBR_CELL,) * start_idx
+            + tuple(
+                self._format_forecast_cell(format_progress(reading, forecast_date, raw_value=True))
+                for forecast_date in dates[start_idx:end_idx]
+            )
+            + (_DONE_CELL,) * (len(dates) - end_idx)
+        )
+
+    def _generate_reading_row(self, vm: _RowVM, is_current: bool = True) -> str:
+        """Generate HTML table row for a reading."""
+        row_template = _ROW_TMPL_CURRENT if is_current else _ROW_TMPL_UPCOMING
+        return row_template.format_map({
+            'cover_cell': vm.cover_cell,
+            'media_badge': vm.media_badge,
+            'title': vm.title,
+            'author': vm.author_full,
+            'progress': vm.progress_cell,
+            'start_date': vm.start_str,
+            'end_date': vm.end_str,
+        })
+
+    def _generate_html_table(self, readings: List[Reading], title: str, vms: Dict[int, _RowVM],
+                             is_current: bool = True) -> str:
+        """Generate HTML table for readings."""
+        if not readings:
+            return f"<h2>{title}</h2><p>No readings found.</p>"
+
+        parts = [
+            _TABLE_TITLE_OPEN, title, _TABLE_TITLE_CLOSE,
+            _TABLE_HEAD_CURRENT if is_current else _TABLE_HEAD_UPCOMING
+        ]
+        parts.extend(self._generate_reading_row(vms[reading.id], is_current) for reading in readings)
+        parts.append(_TABLE_CLOSE)
+        return "".join(parts)
+
+    def _generate_html_content(self, current_readings: List[Reading], upcoming_readings: List[Reading],
+                               all_readings: List[Reading], today: date) -> str:
+        """Generate complete HTML email content."""
+        vms = self._build_view_models(current_readings, upcoming_readings, all_readings, today)
+        current_table = self._generate_html_table(current_readings, "Currently Reading", vms, True)
+        upcoming_table = self._generate_html_table(upcoming_readings, "Coming Soon", vms, False)
+        forecast_table = self._generate_forecast_table(all_readings, today, vms)
+
+        today_date = _fmt_month_d(today)  # Format like "March 5"
+
+        return (_PAGE_PREFIX + today_date + _PAGE_INTRO_END
+                + current_table + upcoming_table + forecast_table + _PAGE_SUFFIX)
+
+    def _format_forecast_cell(self, progress: str) -> str:
+        """Format forecast cell content for email HTML."""
+        status_cell = _STATUS_CELLS.get(progress)
+        if status_cell is not None:
+            return status_cell
+
+        if progress.endswith("%"):
+            try:
+                return _format_pct_cell(int(progress[:-1]))
+            except ValueError:
+                return progress
+
+        return progress
+
+    def _generate_forecast_table(self, readings: List[Reading], today: date, vms: Dict[int, _RowVM]) -> str:
+        """Generate HTML table for weekly progress forecast."""
+        if not readings:
+            return "<p>No current or upcoming readings found for the next 7 days.</p>"
+
+        dates = [today + timedelta(days=i) for i in range(_FORECAST_DAYS)]  # Changed from 8 to 7
+        day_headers = [_fmt_day_abbr(d) for d in dates]
+
+        parts = [_FORECAST_TABLE_OPEN]
 
         # Add date columns
-        for d in dates:
-            day_name = d.strftime('%a')
-            table += f"""
+        for day_name in day_headers:
+            parts.append(f"""
                 <th style="text-align: center; padding: 12px; background-color: #f8fafc; min-width: 55px; width: 55px;">
                     {day_name}
-                </th>"""
+                </th>""")
 
-        table += "</tr></thead><tbody>"
+        parts.append("</tr></thead><tbody>")
 
         # Use readings directly without any additional sorting
         for reading in readings:
-            media_badge = self.status_display._format_media_badge(reading.media)
-            color = '#1e293b'  # Default text color
-
-            row = f"""
+            vm = vms[reading.id]
+            parts.append(f"""
                 <tr>
-                    <td style="padding: 12px;">{media_badge}</td>
+                    <td style="padding: 12px;">{vm.media_badge}</td>
                     <td style="padding: 12px;">
-                        <div style="font-weight: 600;">{reading.book.title}</div>
-                        <div style="color: #64748b; font-size: 14px;">{reading.book.author_name_first} {reading.book.author_name_second}</div>
+                        <div style="font-weight: 600;">{vm.title}</div>
+                        <div style="color: #64748b; font-size: 14px;">{vm.author_full}</div>
                     </td>
-            """
-
-            # Add progress forecasts for each date
-            for forecast_date in dates:
-                progress = self.status_display._format_forecast_progress(reading, forecast_date, raw_value=True)
-                formatted_progress = self._format_forecast_cell(progress)
-                row += f'<td style="text-align: center; padding: 12px;">{formatted_progress}</td>'
+            """)
+            parts.append(_FORECAST_CELL_OPEN + _FORECAST_CELL_JOIN.join(vm.forecast_cells) + _FORECAST_CELL_CLOSE)
+            parts.append("</tr>")
 
-            row += "</tr>"
-            table += row
-
-        table += "</tbody></table></div></div>"
-        return table
+        parts.append(_FORECAST_TABLE_CLOSE)
+        return "".join(parts)
 
     def _get_app_password(self):
         """Get Gmail app password from environment."""
@@ -280,21 +417,85 @@ class EmailReport:
             )
         return password
 
-    def _get_book_cover_url(self, title: str, author: str, book_id: int = None) -> str:
-        """Get book cover URL, first checking local storage then external APIs."""
-        cache_key = f"{title}-{author}"
-        if cache_key in self.image_cids:
-            return f"cid:{self.image_cids[cache_key][0]}"
-
-        # Check local storage first
-        if book_id:
-            cover_path = get_project_paths()['assets'] / 'book_covers' / f'{book_id}.jpg'
-            if cover_path.exists():
-                with open(cover_path, 'rb') as f:
-                    img_data = f.read()
-                cid = f"cover_{book_id}@reading.list"
-                self.image_cids[cache_key] = (cid, img_data, 'image/jpeg')
-                return f"cid:{cid}"
+    def _get_smtp(self, password: str) -> 'smtplib.SMTP':
+        """Return an authenticated SMTP connection, reusing the previous one if still alive."""
+        import smtplib
+
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+
+        logger.debug("Connecting to SMTP server %s:%s", self.smtp_server, self.smtp_port)
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            logger.debug("Starting TLS")
+            server.starttls()
+
+            logger.debug("Attempting login for %s", self.sender_email)
+            server.login(self.sender_email, password)
+        except Exception:
+            server.close()
+            raise
+
+        self._smtp = server
+        return server
+
+    def close(self):
+        """Close the SMTP connection kept open between sends and stop the cover reader threads."""
+        self._close_smtp()
+        self._io_pool.shutdown(wait=True)
+        self.image_cids.clear()
+
+    def _close_smtp(self):
+        """Close the cached SMTP connection, if any."""
+        if self._smtp is None:
+            return
+        import smtplib
+
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    def _scan_cover_ids(self) -> set:
+        """Collect the ids of all local .jpg covers with a single directory scan."""
+        try:
+            with os.scandir(self._covers_dir) as entries:
+                return {
+                    int(e.name[:-4]) for e in entries
+                    if e.name.endswith('.jpg') and e.name[:-4].isdigit() and e.is_file()
+                }
+        except FileNotFoundError:
+            return set()
+
+    def _prefetch_covers(self, readings: List[Reading]):
+        """Start reading cover files in the background while the HTML is being built."""
+        for reading in readings:
+            book_id = reading.book.id
+            if book_id in self._cover_ids and book_id not in self._cover_futures:
+                self._cover_futures[book_id] = self._io_pool.submit(_load_cover, book_id, self._covers_dir)
+
+    def _get_book_cover_url(self, book_id: Optional[int]) -> Optional[str]:
+        """Get the inline (cid:) URL for a book's locally stored cover."""
+        entry = self.image_cids.get(book_id)
+        if entry is not None:
+            return f"cid:{entry.cid}"
+
+        if book_id in self._cover_ids:
+            future = self._cover_futures.get(book_id)
+            cover = future.result() if future else _load_cover(book_id, self._covers_dir)
+            if cover is not None:
+                img_data, encoded = cover
+                entry = CoverEntry(
+                    cid=f"cover_{book_id}@reading.list", data=img_data, mime='image/jpeg', encoded=encoded
+                )
+                self.image_cids[book_id] = entry
+                return f"cid:{entry.cid}"
 
         return None
 
@@ -303,17 +504,37 @@ class EmailReport:
         try:
             password = self._get_app_password()
 
-            # Use ReadingStatus for consistent data access
+            today = date.today()
+
+            # Use ReadingStatus for consistent data access; query everything once per send
             status_model = ReadingStatus()
+            self._status_model = status_model
+            self.status_display.model = status_model
             current_readings = status_model.get_current_readings()
             upcoming_readings = status_model.get_upcoming_readings()
+            all_readings = status_model.get_forecast_readings(
+                current_readings=current_readings,
+                upcoming_readings=upcoming_readings
+            )
+
+            # Pick up covers fetched or replaced since the last send
+            self.image_cids.clear()
+            self._cover_ids = self._scan_cover_ids()
+
+            # Generate HTML content, overlapping cover file reads with the string building
+            self._prefetch_covers(current_readings + upcoming_readings)
+            try:
+                html_content = self._generate_html_content(current_readings, upcoming_readings, all_readings, today)
+            finally:
+                self._cover_futures.clear()
 
-            # Generate HTML content
-            html_content = self._generate_html_content(current_readings, upcoming_readings)
+            # Mail modules are only imported once a report is actually being sent
+            import smtplib
+            from email.message import EmailMessage, MIMEPart
 
             # Create email message
-            msg = MIMEMultipart('related')
-            msg['Subject'] = f"Your Daily Reading Update for {date.today().strftime('%B %d')}!"
+            msg = EmailMessage()
+            msg['Subject'] = f"Your Daily Reading Update for {_fmt_month_dd(today)}!"
             # Use a friendly display name with the email address
             msg['From'] = f'"Reading Tracker" <{self.sender_email}>'
             msg['To'] = self.receiver_email
@@ -351,59 +572,59 @@ class EmailReport:
             # Add signature to the main HTML content
             html_content = html_content.replace('</body>', f'{signature_html}</body>')
 
-            msg_alternative = MIMEMultipart('alternative')
-            msg.attach(msg_alternative)
-
             # Add plain text and HTML versions
-            msg_alternative.attach(MIMEText("Please view this email in an HTML-capable email client.", 'plain'))
-            msg_alternative.attach(MIMEText(html_content, 'html'))
+            msg.set_content("Please view this email in an HTML-capable email client.")
+            msg.add_alternative(html_content, subtype='html')
+            html_part = msg.get_payload()[1]
 
             # Add profile image
             profile_image_path = get_project_paths()['assets'] / 'email' / 'profile.png'
             if profile_image_path.exists():
-                with open(profile_image_path, 'rb') as img_file:
-                    img = MIMEImage(img_file.read())
-                    img.add_header('Content-ID', '<profile_image>')
-                    img.add_header('Content-Disposition', 'inline')
-                    msg.attach(img)
-
-            # Attach all images
-            for cid, (content_id, img_data, mime_type) in self.image_cids.items():
-                img = MIMEImage(img_data)
-                img.add_header('Content-ID', f'<{content_id}>')
-                img.add_header('Content-Disposition', 'inline')
-                msg.attach(img)
+                html_part.add_related(
+                    profile_image_path.read_bytes(), maintype='image', subtype='png',
+                    cid='<profile_image>', disposition='inline'
+                )
+
+            # Attach all images, reusing the cached base64 bodies instead of re-encoding
+            if self.image_cids and html_part.get_content_type() != 'multipart/related':
+                html_part.make_related()
+            for entry in self.image_cids.values():
+                img = MIMEPart()
+                img['Content-Type'] = entry.mime
+                img['Content-Transfer-Encoding'] = 'base64'
+                img['Content-Disposition'] = 'inline'
+                img['Content-ID'] = f'<{entry.cid}>'
+                img.set_payload(entry.encoded)
+                html_part.attach(img)
 
             # Enhanced SMTP connection and authentication
             try:
-                print("Connecting to SMTP server...")
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    print("Starting TLS...")
-                    server.starttls()
+                server = self._get_smtp(password)
 
-                    print(f"Attempting login for {self.sender_email}...")
-                    server.login(self.sender_email, password)
-
-                    print("Sending email...")
-                    server.send_message(msg)
-                    print("Email sent successfully!")
-                    return True
+                logger.debug("Sending email")
+                server.send_message(msg)
+                logger.info("Email sent successfully")
+                return True
 
             except smtplib.SMTPAuthenticationError as auth_error:
-                print(f"Authentication failed: {auth_error}")
-                print("Please verify your Gmail App Password and sender email address")
-                print("Generate a new App Password at: https://myaccount.google.com/apppasswords")
+                logger.error(
+                    "Authentication failed: %s. Please verify your Gmail App Password and sender "
+                    "email address; generate a new App Password at https://myaccount.google.com/apppasswords",
+                    auth_error
+                )
                 return False
 
             except smtplib.SMTPException as smtp_error:
-                print(f"SMTP error occurred: {smtp_error}")
+                logger.error("SMTP error occurred: %s", smtp_error)
                 return False
 
         except Exception as e:
-            print(f"Error sending email: {str(e)}")
-            print("\nTroubleshooting steps:")
-            print("1. Check that GMAIL_APP_PASSWORD is set in your .env file")
-            print("2. Verify SENDER_EMAIL matches the Gmail account")
-            print("3. Ensure 2-Step Verification is enabled")
-            print("4. Try generating a new App Password")
+            logger.error(
+                "Error sending email: %s\n\nTroubleshooting steps:\n"
+                "1. Check that GMAIL_APP_PASSWORD is set in your .env file\n"
+                "2. Verify SENDER_EMAIL matches the Gmail account\n"
+                "3. Ensure 2-Step Verification is enabled\n"
+                "4. Try generating a new App Password",
+                e
+            )
             return False
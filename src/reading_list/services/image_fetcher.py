@@ -1,19 +1,82 @@
-"""Service for fetching images from Google."""
+"""Service for fetching book cover images from Open Library and Google."""
 import aiohttp
 import asyncio
+import imagesize
+import os
+import random
+import re
+import stat
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import List
-from urllib.parse import quote
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional, Tuple
+from PIL import Image
 from rich.console import Console
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.orm import Session
 from ..utils.paths import get_project_paths
-import random
-import time
-from PIL import Image
-from io import BytesIO
-import re
+
+try:
+    # Optional (pip install .[fast]): HTTP/2 for the repeated google.com searches
+    import httpx
+    import h2  # noqa: F401 - httpx needs it for http2=True
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import aiodns  # noqa: F401 - backs aiohttp.AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# Bounds each request so one slow host can't stall a whole batch
+_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5, sock_read=10)
+
+# Anything smaller is a thumbnail or placeholder rather than a real cover
+_MIN_COVER_BYTES = 5000
+# Downloads are streamed and abandoned past this size
+_MAX_COVER_BYTES = 5 * 1024 * 1024
+_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# Image URLs embedded in the (undecoded) search results page; retail (Amazon) images are preferred
+_AMAZON_JPG = re.compile(rb'https://[^"\']*?amazon[^"\']*?\.jpg')
+_ANY_JPG = re.compile(rb'https://[^"\']*?\.jpg')
+
+@lru_cache(maxsize=None)
+def _covers_path() -> Path:
+    """Covers directory, resolved and created once per process rather than per fetcher."""
+    covers_path = get_project_paths()['assets'] / 'book_covers'
+    covers_path.mkdir(parents=True, exist_ok=True)
+    return covers_path
+
+def _header_size(data: bytearray) -> tuple:
+    """(width, height) from a possibly partial image body, or (-1, -1) if not known yet."""
+    try:
+        return imagesize.get(BytesIO(data))
+    except Exception:
+        return -1, -1
+
+# default=false makes Open Library answer 404 instead of a blank placeholder image
+_OPEN_LIBRARY_COVER_URL = "https://covers.openlibrary.org/b/isbn/{isbn}-L.jpg?default=false"
+
+# Search details for a whole batch of books in one round-trip
+_BOOKS_BY_ID_QUERY = text("""
+    SELECT 
+        b.id,
+        b.title,
+        b.author_name_first,
+        b.author_name_second,
+        MAX(COALESCE(NULLIF(i.isbn_13, ''), NULLIF(i.isbn_10, ''))) as isbn
+    FROM books b
+    LEFT JOIN inv i ON i.book_id = b.id
+    WHERE b.id IN :book_ids
+    GROUP BY b.id
+""").bindparams(bindparam('book_ids', expanding=True))
+
+_MARK_COVERS_QUERY = text(
+    "UPDATE books SET cover = TRUE WHERE id IN :book_ids"
+).bindparams(bindparam('book_ids', expanding=True))
 
 class GoogleImageFetcher:
     def __init__(self, session: Session):
@@ -27,40 +90,44 @@ class GoogleImageFetcher:
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive'
         }
-        project_paths = get_project_paths()
-        self.covers_path = project_paths['assets'] / 'book_covers'
-        self.covers_path.mkdir(parents=True, exist_ok=True)
+        self.covers_path = _covers_path()
         self.min_aspect_ratio = 0.5
         self.max_aspect_ratio = 0.8
         self.retry_delays = [1, 2, 4, 8, 16]  # Exponential backoff delays in seconds
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._search_client = None  # httpx.AsyncClient, only when HTTP/2 is available
 
     def is_valid_cover_dimensions(self, image_data: bytes) -> bool:
         """Check if image has proper book cover dimensions"""
         try:
-            with Image.open(BytesIO(image_data)) as img:
-                width, height = img.size
-                aspect_ratio = width / height
-                return self.min_aspect_ratio <= aspect_ratio <= self.max_aspect_ratio
+            # Only the header is parsed; PIL is the fallback for formats imagesize doesn't know
+            width, height = imagesize.get(BytesIO(image_data))
+            if width <= 0 or height <= 0:
+                with Image.open(BytesIO(image_data)) as img:
+                    width, height = img.size
+            aspect_ratio = width / height
+            return self.min_aspect_ratio <= aspect_ratio <= self.max_aspect_ratio
         except Exception as e:
             self.console.print(f"[red]Error checking image dimensions: {str(e)}[/red]")
             return False
 
-    async def fetch_with_retry(self, session: aiohttp.ClientSession, url: str, params: dict) -> tuple[int, str]:
+    async def fetch_with_retry(self, session: aiohttp.ClientSession, url: str, params: dict) -> Tuple[int, bytes]:
         """Fetch URL with retry logic and exponential backoff."""
         for attempt, delay in enumerate(self.retry_delays):
             try:
-                # Add random delay between requests
-                await asyncio.sleep(random.uniform(1.0, 3.0))
+                # Small polite jitter, only when retrying after a rate limit or failure
+                if attempt > 0:
+                    await asyncio.sleep(random.uniform(0.1, 0.3))
                 
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        return response.status, await response.text()
-                    elif response.status == 429:
-                        if attempt < len(self.retry_delays) - 1:
-                            self.console.print(f"[yellow]Rate limited. Waiting {delay} seconds before retry...[/yellow]")
-                            await asyncio.sleep(delay)
-                            continue
-                    return response.status, ""
+                status, body = await self._get_page(session, url, params)
+                if status == 200:
+                    return status, body
+                elif status == 429:
+                    if attempt < len(self.retry_delays) - 1:
+                        self.console.print(f"[yellow]Rate limited. Waiting {delay} seconds before retry...[/yellow]")
+                        await asyncio.sleep(delay)
+                        continue
+                return status, b""
             except Exception as e:
                 if attempt < len(self.retry_delays) - 1:
                     self.console.print(f"[yellow]Request failed: {str(e)}. Retrying in {delay} seconds...[/yellow]")
@@ -68,31 +135,180 @@ class GoogleImageFetcher:
                     continue
                 raise
 
+    async def _get_page(self, session: aiohttp.ClientSession, url: str, params: dict) -> Tuple[int, bytes]:
+        """GET a search page as raw bytes, multiplexed over HTTP/2 when httpx is installed."""
+        client = self._ensure_search_client()
+        if client is not None:
+            response = await client.get(url, params=params, timeout=httpx.Timeout(20, connect=5, read=10))
+            return response.status_code, response.content if response.status_code == 200 else b""
+
+        async with session.get(url, params=params, timeout=_HTTP_TIMEOUT) as response:
+            return response.status, await response.read() if response.status == 200 else b""
+
+    def _ensure_search_client(self):
+        """HTTP/2 client for search requests, or None to stay on aiohttp."""
+        if HTTP2_AVAILABLE and self._search_client is None:
+            # Connection-specific headers are not allowed over HTTP/2
+            headers = {k: v for k, v in self.headers.items() if k != 'Connection'}
+            self._search_client = httpx.AsyncClient(
+                http2=True,
+                headers=headers,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+            )
+        return self._search_client
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """HTTP session with a pooled, keep-alive connector, opened on first use and reused."""
+        if self._http_session is None or self._http_session.closed:
+            # aiodns (pip install .[fast]) keeps lookups off the loop thread; the cache spans the batch
+            resolver = aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+            connector = aiohttp.TCPConnector(
+                resolver=resolver,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                limit=32,
+                limit_per_host=8,
+                keepalive_timeout=60
+            )
+            self._http_session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+        return self._http_session
+
+    async def aclose(self):
+        """Close the shared HTTP session (and HTTP/2 search client), if opened."""
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+        if self._search_client is not None:
+            await self._search_client.aclose()
+            self._search_client = None
+
+    async def fetch_all(self, book_ids: List[int]) -> Dict[int, bool]:
+        """Fetch covers for several books concurrently over one HTTP session."""
+        book_ids = list(dict.fromkeys(book_ids))
+
+        # Covers already on disk need no lookup or network round-trip at all
+        results = {book_id: True for book_id in book_ids if self._has_cover_file(book_id)}
+        for book_id in results:
+            self.console.print(f"[dim]Cover already exists for book ID {book_id}[/dim]")
+        to_fetch = [book_id for book_id in book_ids if book_id not in results]
+
+        if to_fetch:
+            books = self._get_books(to_fetch)
+            session = await self._ensure_session()
+            fetched = await asyncio.gather(
+                *(self._fetch_one(session, book_id, books.get(book_id)) for book_id in to_fetch)
+            )
+            results.update(zip(to_fetch, fetched))
+
+        self._mark_covers([book_id for book_id in book_ids if results[book_id]])
+        return {book_id: results[book_id] for book_id in book_ids}
+
     async def fetch_book_cover(self, book_id: int) -> bool:
         """Fetch and save book cover for the given book ID."""
+        return (await self.fetch_all([book_id]))[book_id]
+
+    def _has_cover_file(self, book_id: int) -> bool:
+        """Whether a usable cover for book_id is already saved."""
+        try:
+            st = os.stat(self.covers_path / f"{book_id}.jpg")
+        except OSError:
+            return False
+        return stat.S_ISREG(st.st_mode) and st.st_size >= _MIN_COVER_BYTES
+
+    def _get_books(self, book_ids: List[int]) -> dict:
+        """Map book IDs to their title/author rows with a single query."""
+        if not book_ids:
+            return {}
+        rows = self.session.execute(_BOOKS_BY_ID_QUERY, {"book_ids": book_ids}).fetchall()
+        return {row.id: row for row in rows}
+
+    def _mark_covers(self, book_ids: List[int]):
+        """Flag saved covers in one UPDATE and one commit for the whole batch."""
+        if not book_ids:
+            return
+        self.session.execute(_MARK_COVERS_QUERY, {"book_ids": book_ids})
+        self.session.commit()
+
+    async def _head_looks_like_cover(self, session: aiohttp.ClientSession, img_url: str) -> bool:
+        """HEAD the URL and rule out non-images and out-of-range sizes before any body is sent.
+
+        Only headers that are present and clearly wrong reject the URL; hosts that
+        don't support HEAD or omit the headers fall through to the streamed GET.
+        """
+        try:
+            async with session.head(img_url, allow_redirects=True, timeout=_HTTP_TIMEOUT) as head:
+                if head.status != 200:
+                    return head.status not in (404, 410)
+                content_type = head.headers.get('Content-Type', '')
+                if content_type and not content_type.startswith('image/'):
+                    return False
+                length = head.content_length
+                return length is None or _MIN_COVER_BYTES <= length <= _MAX_COVER_BYTES
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return True
+
+    async def _download_image(self, session: aiohttp.ClientSession, img_url: str) -> Optional[bytes]:
+        """Download one candidate image; None if it failed, timed out or was rejected early.
+
+        The body is streamed so oversized images and ones whose header already
+        shows the wrong proportions are abandoned without downloading the rest.
+        """
+        if not await self._head_looks_like_cover(session, img_url):
+            return None
+        try:
+            async with session.get(img_url, timeout=_HTTP_TIMEOUT) as img_response:
+                if img_response.status != 200:
+                    return None
+                if (img_response.content_length or 0) > _MAX_COVER_BYTES:
+                    return None
+
+                buf = bytearray()
+                header_checked = False
+                async for chunk in img_response.content.iter_chunked(_DOWNLOAD_CHUNK_BYTES):
+                    buf.extend(chunk)
+                    if len(buf) > _MAX_COVER_BYTES:
+                        return None
+                    if not header_checked:
+                        width, height = _header_size(buf)
+                        if width > 0 and height > 0:
+                            header_checked = True
+                            if not self.min_aspect_ratio <= width / height <= self.max_aspect_ratio:
+                                return None
+                return bytes(buf)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+    def _is_usable_cover(self, content: bytes) -> bool:
+        """Reject thumbnails/placeholders and images without book cover proportions."""
+        if len(content) < _MIN_COVER_BYTES:  # Skip very small files
+            return False
+        return self.is_valid_cover_dimensions(content)
+
+    async def _save_cover(self, output_path: Path, content: bytes):
+        """Write the cover on the default thread pool so other downloads keep going meanwhile."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, output_path.write_bytes, content)
+
+    async def _fetch_one(self, session: aiohttp.ClientSession, book_id: int, book) -> bool:
+        """Fetch and save one book cover using the caller's HTTP session and prefetched book row."""
         try:
-            # Get book details from database
-            result = self.session.execute(
-                text("""
-                    SELECT 
-                        title,
-                        author_name_first,
-                        author_name_second
-                    FROM books 
-                    WHERE id = :book_id
-                """),
-                {"book_id": book_id}
-            )
-            book = result.fetchone()
-            
             if not book:
                 self.console.print(f"[red]Book with ID {book_id} not found[/red]")
                 return False
             
+            output_path = self.covers_path / f"{book_id}.jpg"
+
+            # A direct cover lookup by ISBN is one GET with nothing to parse; scrape Google only without one
+            if book.isbn:
+                content = await self._download_image(session, _OPEN_LIBRARY_COVER_URL.format(isbn=book.isbn))
+                if content is not None and self._is_usable_cover(content):
+                    await self._save_cover(output_path, content)
+                    self.console.print(f"[green]Cover saved for book ID {book_id} (Open Library)[/green]")
+                    return True
+
             # Construct search term
             author = f"{book.author_name_first or ''} {book.author_name_second or ''}".strip()
             search_term = f"{book.title} {author} book cover"
-            output_path = self.covers_path / f"{book_id}.jpg"
             
             # Prepare search query
             params = {
@@ -101,53 +317,43 @@ class GoogleImageFetcher:
                 'tbs': 'isz:l'  # Large images
             }
             
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                status, html = await self.fetch_with_retry(session, self.search_url, params)
-                
-                if status != 200:
-                    self.console.print(f"[red]Search failed with status {status}[/red]")
-                    return False
-                
-                # Look for high-quality retail images first (usually Amazon, etc.)
-                matches = re.findall(r'https://[^"\']*?amazon[^"\']*?\.jpg', html)
-                if not matches:
-                    matches = re.findall(r'https://[^"\']*?\.jpg', html)
+            status, html = await self.fetch_with_retry(session, self.search_url, params)
+            
+            if status != 200:
+                self.console.print(f"[red]Search failed with status {status}[/red]")
+                return False
+            
+            # Look for high-quality retail images first (usually Amazon, etc.)
+            matches = _AMAZON_JPG.findall(html) or _ANY_JPG.findall(html)
+            
+            for img_url in matches:
+                img_url = img_url.decode('ascii', 'ignore').replace('\\u003d', '=').replace('\\', '')
                 
-                for img_url in matches:
-                    img_url = img_url.replace('\\u003d', '=').replace('\\', '')
+                content = await self._download_image(session, img_url)
+                if content is None or not self._is_usable_cover(content):
+                    continue
                     
-                    async with session.get(img_url) as img_response:
-                        if img_response.status == 200:
-                            content = await img_response.read()
-                            
-                            # Basic validation
-                            if len(content) < 5000:  # Skip very small files
-                                continue
-                                
-                            # Check image dimensions
-                            if not self.is_valid_cover_dimensions(content):
-                                continue
-                                
-                            # Save the image
-                            output_path.write_bytes(content)
-                            
-                            # Update book's cover status
-                            self.session.execute(
-                                text("UPDATE books SET cover = TRUE WHERE id = :book_id"),
-                                {"book_id": book_id}
-                            )
-                            self.session.commit()
-                            
-                            self.console.print(f"[green]Cover saved for book ID {book_id}[/green]")
-                            return True
-                
-                self.console.print("[yellow]No suitable images found[/yellow]")
-                return False
+                # Save the image; the caller flags the book's cover status
+                await self._save_cover(output_path, content)
                 
+                self.console.print(f"[green]Cover saved for book ID {book_id}[/green]")
+                return True
+            
+            self.console.print(f"[yellow]No suitable images found for book ID {book_id}[/yellow]")
+            return False
+            
         except Exception as e:
             self.console.print(f"[red]Error fetching cover for book {book_id}: {str(e)}[/red]")
             return False
 
+async def _fetch_covers(session: Session, book_ids: List[int]) -> Dict[int, bool]:
+    """Fetch covers with a fetcher whose HTTP session lives only as long as this call."""
+    fetcher = GoogleImageFetcher(session)
+    try:
+        return await fetcher.fetch_all(book_ids)
+    finally:
+        await fetcher.aclose()
+
 def download_book_cover(session: Session, book_id: int) -> bool:
     """
     Synchronous wrapper for fetching book cover from Google Images.
@@ -159,5 +365,17 @@ def download_book_cover(session: Session, book_id: int) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    fetcher = GoogleImageFetcher(session)
-    return asyncio.run(fetcher.fetch_book_cover(book_id))
+    return asyncio.run(_fetch_covers(session, [book_id]))[book_id]
+
+def download_book_covers(session: Session, book_ids: List[int]) -> Dict[int, bool]:
+    """
+    Synchronous wrapper for fetching several book covers concurrently.
+    
+    Args:
+        session: SQLAlchemy database session
+        book_ids: IDs of the books to fetch covers for
+        
+    Returns:
+        Dict[int, bool]: Success flag per book ID
+    """
+    return asyncio.run(_fetch_covers(session, book_ids))
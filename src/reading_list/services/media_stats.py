@@ -3,6 +3,7 @@ from datetime import datetime
 import csv
 import os
 from pathlib import Path
+from typing import List, Tuple
 from rich.console import Console
 from rich.table import Table
 from ..models.base import engine
@@ -10,38 +11,43 @@ from sqlalchemy import text
 
 console = Console()
 
+# Per-media rows followed by one totals row (is_total = 1). SQLite has no ROLLUP,
+# and the totals sum the per-media counts, matching the percentages shown.
+_STATS_SQL = """
+    WITH per_media AS (
+        SELECT
+            r.media,
+            COUNT(DISTINCT r.book_id) as book_count,
+            COALESCE(SUM(b.word_count), 0) as total_words,
+            COALESCE(SUM(b.page_count), 0) as total_pages
+        FROM read r
+        INNER JOIN books b ON r.book_id = b.id
+        {where}
+        GROUP BY r.media
+    )
+    SELECT media, book_count, total_words, total_pages, 0 as is_total
+    FROM per_media
+    UNION ALL
+    SELECT
+        NULL,
+        COALESCE(SUM(book_count), 0),
+        COALESCE(SUM(total_words), 0),
+        COALESCE(SUM(total_pages), 0),
+        1
+    FROM per_media
+    ORDER BY is_total, book_count DESC
+"""
+
+# Built once per variant so SQLAlchemy's compiled cache is keyed on the same statement every run
+_STATS_ALL_QUERY = text(_STATS_SQL.format(where=""))
+_STATS_FINISHED_QUERY = text(_STATS_SQL.format(where="WHERE r.date_finished_actual IS NOT NULL"))
+
 class MediaStatsService:
     """Service for generating and displaying media statistics."""
     
     def __init__(self):
         self.console = Console()
 
-    def _get_stats_query(self, finished_only: bool) -> str:
-        """Get the SQL query for media statistics."""
-        finished_condition = "AND r.date_finished_actual IS NOT NULL" if finished_only else ""
-        
-        # Debug query to check data
-        print("DEBUG QUERY:")
-        print("""
-            SELECT b.title, b.word_count, b.page_count, r.media
-            FROM books b
-            INNER JOIN read r ON b.id = r.book_id
-            LIMIT 5;
-        """)
-        
-        return f"""
-            SELECT
-                r.media,
-                COUNT(DISTINCT r.book_id) as book_count,
-                COALESCE(SUM(b.word_count), 0) as total_words,
-                COALESCE(SUM(b.page_count), 0) as total_pages
-            FROM read r
-            INNER JOIN books b ON r.book_id = b.id
-            {finished_condition}
-            GROUP BY r.media
-            ORDER BY book_count DESC
-        """
-
     def _get_media_color(self, media: str) -> str:
         """Get the display color for a media type."""
         media_colors = {
@@ -51,7 +57,18 @@ class MediaStatsService:
         }
         return media_colors.get(media.lower(), 'white')
 
-    def _create_stats_table(self, results, total_books, total_words, finished_only: bool) -> Table:
+    def _format_rows(self, results, total_books, total_words) -> List[Tuple[str, int, int, str, str]]:
+        """Compute (media, books, words, books %, words %) once for the table and CSV."""
+        rows = []
+        for row in results:
+            books = row[1]
+            words = row[2] or 0
+            books_percent = (books / total_books * 100) if total_books else 0
+            words_percent = (words / total_words * 100) if total_words else 0
+            rows.append((row[0] or "Unknown", books, words, f"{books_percent:.1f}%", f"{words_percent:.1f}%"))
+        return rows
+
+    def _create_stats_table(self, rows, total_books, total_words, finished_only: bool) -> Table:
         """Create a rich table for displaying media statistics."""
         status = "Finished" if finished_only else "All"
         table = Table(title=f"Reading Statistics by Media ({status} Books)")
@@ -62,19 +79,13 @@ class MediaStatsService:
         table.add_column("Books %", justify="right")
         table.add_column("Words %", justify="right")
 
-        for row in results:
-            media = row[0] or "Unknown"
-            books = row[1]
-            words = row[2] or 0
-            books_percent = (books / total_books * 100) if total_books else 0
-            words_percent = (words / total_words * 100) if total_words else 0
-
+        for media, books, words, books_percent, words_percent in rows:
             table.add_row(
                 media,
                 str(books),
                 f"{words:,}",
-                f"{books_percent:.1f}%",
-                f"{words_percent:.1f}%",
+                books_percent,
+                words_percent,
                 style=self._get_media_color(media)
             )
 
@@ -89,7 +100,7 @@ class MediaStatsService:
 
         return table
 
-    def _save_to_csv(self, results, total_books, total_words, finished_only: bool) -> Path:
+    def _save_to_csv(self, rows, finished_only: bool) -> Path:
         """Save statistics to a CSV file."""
         csv_dir = Path("csv")
         csv_dir.mkdir(exist_ok=True)
@@ -99,22 +110,10 @@ class MediaStatsService:
         filename = f"media_stats_{status}_{timestamp}.csv"
         filepath = csv_dir / filename
 
-        with open(filepath, 'w', newline='') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(['Media', 'Books', 'Words', 'Books %', 'Words %'])
-            for row in results:
-                media = row[0] or "Unknown"
-                books = row[1]
-                words = row[2] or 0
-                books_percent = (books / total_books * 100) if total_books else 0
-                words_percent = (words / total_words * 100) if total_words else 0
-                writer.writerow([
-                    media,
-                    books,
-                    words,
-                    f"{books_percent:.1f}%",
-                    f"{words_percent:.1f}%"
-                ])
+            writer.writerows(rows)
 
         return filepath
 
@@ -127,17 +126,18 @@ class MediaStatsService:
             csv_output: If True, also save results to CSV
         """
         with engine.connect() as conn:
-            query = self._get_stats_query(finished_only)
-            results = conn.execute(text(query)).fetchall()
+            query = _STATS_FINISHED_QUERY if finished_only else _STATS_ALL_QUERY
+            *results, totals = conn.execute(query).fetchall()
 
-            total_books = sum(row[1] for row in results)
-            total_words = sum(row[2] or 0 for row in results)
+            total_books = totals.book_count
+            total_words = totals.total_words
+            rows = self._format_rows(results, total_books, total_words)
 
             if csv_output:
-                filepath = self._save_to_csv(results, total_books, total_words, finished_only)
+                filepath = self._save_to_csv(rows, finished_only)
                 console.print(f"\nCSV file has been created: {filepath}")
 
-            table = self._create_stats_table(results, total_books, total_words, finished_only)
+            table = self._create_stats_table(rows, total_books, total_words, finished_only)
             console.print("\n")
             console.print(table)
             console.print("\n")
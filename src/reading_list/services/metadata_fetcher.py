@@ -1,5 +1,11 @@
 import asyncio
 import aiohttp
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Any
 from urllib.parse import quote
@@ -10,13 +16,149 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Confirm
 from rich.style import Style
+from rich.text import Text
 from rich import box
+from sqlalchemy import or_, update
 
 from ..models.base import SessionLocal
 from ..models.book import Book
 from ..models.isbn import ISBN
 from ..utils.paths import get_project_paths
 
+try:
+    # Optional (pip install .[fast]): much faster decoding of the API replies
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Re-runs within a day replay API lookups from data/cache instead of the network
+_API_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Rich repaints at most this often, and is handed coalesced counts
+_PROGRESS_REFRESH_PER_SECOND = 5
+_PROGRESS_BATCH = 25
+_PROGRESS_INTERVAL = 0.1
+
+_COVER_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.webp'})
+
+# fields= projections so the APIs return only what each lookup reads; items whose
+# projected volumeInfo would be empty come back without a volumeInfo key at all
+_GOOGLE_COVER_FIELDS = 'items(volumeInfo(title,authors,imageLinks))'
+_GOOGLE_ISBN_FIELDS = 'items(volumeInfo(industryIdentifiers))'
+_GOOGLE_PAGES_FIELDS = 'items(volumeInfo(pageCount))'
+
+_OPEN_LIBRARY_COVER_URL = "https://covers.openlibrary.org/b/id/{cover_id}-L.jpg?default=false"
+
+# Cover downloads are read in small chunks until PIL can parse the image header
+_HEADER_CHUNK_BYTES = 4096
+_MAX_HEADER_BYTES = 64 * 1024
+_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+def _image_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """(width, height) parsed from the image header in data, or None if it's not there yet."""
+    try:
+        with Image.open(BytesIO(data)) as img:
+            return img.size
+    except Exception:
+        return None
+
+def _write_atomic(path: Path, data: bytes):
+    """Write data to a temp file beside path, then swap it into place."""
+    tmp_path = path.with_suffix('.tmp')
+    try:
+        tmp_path.write_bytes(data)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+
+def _isbn_key(value) -> str:
+    """Comparable form of an identifier.
+
+    isbn_10/isbn_13 are INTEGER columns, so SQLite stores digit-only values as
+    numbers and drops leading zeros; normalize both sides the same way.
+    """
+    return str(value).lstrip('0')
+
+def _encode_query(title: str, author: str) -> Tuple[str, str, str]:
+    """URL-encoded (Google Books q, OpenLibrary title, OpenLibrary author) for one book."""
+    return (
+        quote(f"intitle:\"{title}\" inauthor:\"{author}\""),
+        quote(title.lower().replace(' ', '+')),
+        quote(author.lower().replace(' ', '+'))
+    )
+
+# Pre-built styles for proposed-change cells, so rows skip markup parsing
+_RED = Style(color="red")
+_YELLOW = Style(color="yellow")
+_WHITE = Style(color="white")
+_ITALIC_RED = Style(color="red", italic=True)
+_BOLD_GREEN = Style(color="green", bold=True)
+_PROPOSED_COVER_STYLES = {
+    "Add new cover": _BOLD_GREEN,
+    "Update cover": Style(color="yellow", bold=True),
+    "No cover found": Style(color="red", bold=True)
+}
+
+# SQL predicate selecting the books that are missing each kind of metadata
+_NEEDS_METADATA = {
+    'covers': Book.cover.isnot(True),
+    'isbn': Book.isbn_id.is_(None),
+    'dates': Book.date_published.is_(None),
+    'pages': Book.page_count.is_(None),
+    'words': Book.word_count.is_(None),
+    'series': Book.series.is_(None),
+    'author': or_(Book.author_name_first.is_(None), Book.author_name_second.is_(None))
+}
+
+class ApiResponseCache:
+    """On-disk cache of raw API response bodies keyed by a hash of the request URL."""
+
+    def __init__(self, cache_path: Path, ttl_seconds: int = _API_CACHE_TTL_SECONDS):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.conn = sqlite3.connect(str(cache_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                fetched_at REAL,
+                body BLOB
+            )
+        """)
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the cached body for url if it is younger than the TTL."""
+        row = self.conn.execute(
+            "SELECT fetched_at, body FROM responses WHERE key = ?", (self._key(url),)
+        ).fetchone()
+        if row and time.time() - row[0] < self.ttl_seconds:
+            return row[1]
+        return None
+
+    def put(self, url: str, body: bytes):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, fetched_at, body) VALUES (?, ?, ?)",
+                (self._key(url), time.time(), body)
+            )
+
+    def evict_expired(self) -> int:
+        """Delete responses older than the TTL, returning how many were removed."""
+        with self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?", (time.time() - self.ttl_seconds,)
+            )
+        return cursor.rowcount
+
+    def close(self):
+        self.conn.close()
+
 class MetadataFetcher:
     def __init__(self, force_update: bool = False, missing_only: bool = False):
         self.session = SessionLocal()
@@ -24,14 +166,16 @@ class MetadataFetcher:
         self.force_update = force_update
         self.missing_only = missing_only
         self.max_concurrent_requests = 10
-        self.max_workers = 4
         self.min_aspect_ratio = 0.6
         self.max_aspect_ratio = 0.7
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client_session: Optional[aiohttp.ClientSession] = None
 
         # Set up paths
         project_paths = get_project_paths()
         self.assets_path = project_paths['assets'] / 'book_covers'  # Fix: use dictionary access
         self.assets_path.mkdir(parents=True, exist_ok=True)
+        self.api_cache: Optional[ApiResponseCache] = ApiResponseCache(project_paths['cache'] / 'metadata_api_cache.sqlite')
 
         # API endpoints
         self.google_books_url = "https://www.googleapis.com/books/v1/volumes"
@@ -64,121 +208,247 @@ class MetadataFetcher:
 
     def update_cover_status(self):
         """Scan assets directory and update cover status in database"""
-        books = self.session.query(Book).all()
-        for book in books:
-            has_cover = False
-            for ext in ['.jpg', '.jpeg', '.png', '.webp']:
-                if (self.assets_path / f"book_{book.id}{ext}").exists():
-                    has_cover = True
-                    break
-            if book.cover != has_cover:  # Changed from has_cover to cover
-                book.cover = has_cover  # Changed from has_cover to cover
+        have_cover = self._scan_cover_ids()
+
+        # Two set-based UPDATEs; the WHERE on cover skips rows already in the right state
+        self.session.execute(
+            update(Book)
+            .where(Book.id.in_(have_cover), Book.cover.isnot(True))
+            .values(cover=True)
+        )
+        self.session.execute(
+            update(Book)
+            .where(Book.id.notin_(have_cover), Book.cover.isnot(False))
+            .values(cover=False)
+        )
         self.session.commit()
 
+    def _scan_cover_ids(self) -> set:
+        """IDs of books with an <id>.<ext> cover, from a single directory scan."""
+        have_cover = set()
+        if not self.assets_path.exists():
+            return have_cover
+
+        with os.scandir(self.assets_path) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext in _COVER_EXTS and stem.isdigit():
+                    have_cover.add(int(stem))
+        return have_cover
+
     def get_books_needing_metadata(self, metadata_type: str) -> List[Book]:
         """Get books that need metadata updates"""
         query = self.session.query(Book)
-        
-        if metadata_type == 'pages':
-            if self.missing_only:
-                query = query.filter(Book.page_count.is_(None))
-            elif not self.force_update:
-                query = query.filter(Book.page_count.is_(None))
-        
+
+        # --force revisits every book unless --missing-only narrows it back down
+        if self.missing_only or not self.force_update:
+            query = query.filter(_NEEDS_METADATA[metadata_type])
+
         return query.all()
 
     def is_cover_rectangular(self, image_path: Path) -> bool:
         """Check if image has proper book cover dimensions"""
         try:
             with Image.open(image_path) as img:
-                width, height = img.size
-                aspect_ratio = width / height
-                return self.min_aspect_ratio <= aspect_ratio <= self.max_aspect_ratio
+                return self._has_cover_proportions(*img.size)
         except Exception as e:
             self.console.print(f"[red]Error checking image dimensions for {image_path}: {str(e)}[/red]")
             return False
 
-    async def try_google_books(self, session: aiohttp.ClientSession,
-                             title: str, author: str) -> Optional[str]:
-        """Try to fetch cover from Google Books API"""
-        try:
-            query = quote(f"intitle:\"{title}\" inauthor:\"{author}\"")
-            async with session.get(
-                f"{self.google_books_url}?q={query}&maxResults=10"
-            ) as response:
+    def _has_cover_proportions(self, width: int, height: int) -> bool:
+        """Whether width x height falls within the accepted cover aspect ratios."""
+        return height > 0 and self.min_aspect_ratio <= width / height <= self.max_aspect_ratio
+
+    async def _session(self) -> aiohttp.ClientSession:
+        """Shared keep-alive HTTP session, opened on first use and reused by every phase."""
+        if self._client_session is None or self._client_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent_requests,
+                limit_per_host=self.max_concurrent_requests,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+            self._client_session = aiohttp.ClientSession(connector=connector)
+        return self._client_session
+
+    def _run(self, coro):
+        """Run coro on this fetcher's event loop, which (with its session) persists across phases."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close(self):
+        """Close the API cache, shared HTTP session and event loop. Safe to call more than once."""
+        if self.api_cache is not None:
+            self.api_cache.evict_expired()
+            self.api_cache.close()
+            self.api_cache = None
+        if self._loop is None or self._loop.is_closed():
+            return
+        if self._client_session is not None:
+            self._loop.run_until_complete(self._client_session.close())
+            self._client_session = None
+        self._loop.close()
+
+    async def _get_json(self, session: aiohttp.ClientSession, url: str) -> Optional[Any]:
+        """GET url and decode its JSON body, answering from the API cache when possible.
+
+        Returns None for non-200 responses, which are not cached.
+        """
+        body = None if self.force_update else self.api_cache.get(url)
+        if body is None:
+            async with session.get(url) as response:
                 if response.status != 200:
                     return None
+                body = await response.read()
+            self.api_cache.put(url, body)
+        return _json_loads(body)
+
+    async def _gather_books(self, books: List[Book], fetch, progress=None, task=None) -> List[Any]:
+        """Run fetch(book) for every book on a fixed pool of max_concurrent_requests workers.
+
+        Books are fed through a bounded queue, so only a handful of coroutines exist at
+        any time however large the library. Results come back in the same order as books.
+        """
+        results = [None] * len(books)
+        errors = []
+        # Progress is pushed to Rich in batches rather than once per book
+        done = shown = 0
+        shown_at = time.monotonic()
+        # Created here rather than in __init__ so it binds to the running loop
+        queue = asyncio.Queue(maxsize=self.max_concurrent_requests * 2)
+
+        async def worker():
+            nonlocal done, shown, shown_at
+            while True:
+                index, book = await queue.get()
+                try:
+                    results[index] = await fetch(book)
+                except Exception as e:
+                    errors.append(e)
+                finally:
+                    queue.task_done()
+                done += 1
+                now = time.monotonic()
+                if progress is not None and (done - shown >= _PROGRESS_BATCH
+                                             or now - shown_at >= _PROGRESS_INTERVAL):
+                    progress.update(task, completed=done)
+                    shown, shown_at = done, now
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_concurrent_requests, len(books)))
+        ]
+        try:
+            for item in enumerate(books):
+                await queue.put(item)
+            await queue.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if progress is not None:
+            progress.update(task, completed=done)
+        if errors:
+            raise errors[0]
+        return results
 
-                data = await response.json()
-                if 'items' not in data:
-                    return None
-
-                for item in data['items']:
-                    book_info = item['volumeInfo']
-                    if (title.lower() in book_info.get('title', '').lower() and
-                        author.lower() in book_info.get('authors', [''])[0].lower()):
-
-                        image_links = book_info.get('imageLinks', {})
-                        for img_type in ['extraLarge', 'large', 'medium', 'thumbnail', 'smallThumbnail']:
-                            if cover_url := image_links.get(img_type):
-                                return cover_url.replace('http://', 'https://')
-
-                for item in data['items']:
-                    image_links = item['volumeInfo'].get('imageLinks', {})
-                    if cover_url := (image_links.get('thumbnail') or image_links.get('smallThumbnail')):
-                        return cover_url.replace('http://', 'https://')
+    async def try_google_books(self, session: aiohttp.ClientSession,
+                             title: str, author: str, encoded: Tuple[str, str, str]) -> Optional[str]:
+        """Try to fetch cover from Google Books API"""
+        try:
+            query = encoded[0]
+            data = await self._get_json(
+                session, f"{self.google_books_url}?q={query}&maxResults=10&fields={_GOOGLE_COVER_FIELDS}"
+            )
+            if data is None or 'items' not in data:
+                return None
+
+            title_lc, author_lc = title.lower(), author.lower()
+            for item in data['items']:
+                book_info = item.get('volumeInfo', {})
+                authors = book_info.get('authors') or ('',)
+                if (title_lc in book_info.get('title', '').lower() and
+                    author_lc in authors[0].lower()):
+
+                    image_links = book_info.get('imageLinks', {})
+                    for img_type in ['extraLarge', 'large', 'medium', 'thumbnail', 'smallThumbnail']:
+                        if cover_url := image_links.get(img_type):
+                            return cover_url.replace('http://', 'https://')
+
+            for item in data['items']:
+                image_links = item.get('volumeInfo', {}).get('imageLinks', {})
+                if cover_url := (image_links.get('thumbnail') or image_links.get('smallThumbnail')):
+                    return cover_url.replace('http://', 'https://')
 
         except Exception as e:
             self.console.print(f"[red]Google Books API error: {str(e)}[/red]")
         return None
 
     async def try_openlibrary(self, session: aiohttp.ClientSession,
-                             title: str, author: str) -> Optional[str]:
+                             title: str, author: str, encoded: Tuple[str, str, str]) -> Optional[str]:
         """Try to fetch cover from OpenLibrary API"""
         try:
-            clean_title = quote(title.lower().replace(' ', '+'))
-            clean_author = quote(author.lower().replace(' ', '+'))
+            _, clean_title, clean_author = encoded
 
-            async with session.get(
-                f"{self.openlibrary_url}?title={clean_title}&author={clean_author}"
-            ) as response:
-                if response.status != 200:
-                    return None
+            data = await self._get_json(
+                session, f"{self.openlibrary_url}?title={clean_title}&author={clean_author}&fields=cover_i"
+            )
+            if data is None or not data.get('docs'):
+                return None
 
-                data = await response.json()
-                if not data.get('docs'):
-                    return None
+            cover_id = next((doc['cover_i'] for doc in data['docs'] if doc.get('cover_i')), None)
+            if cover_id is None:
+                return None
 
-                for doc in data['docs']:
-                    if cover_id := doc.get('cover_i'):
-                        for size in ['L', 'M', 'S']:
-                            return f"https://covers.openlibrary.org/b/id/{cover_id}-{size}.jpg"
+            # default=false makes a missing image a 404 instead of a placeholder, so a
+            # HEAD is enough to confirm the cover exists before it is proposed
+            cover_url = _OPEN_LIBRARY_COVER_URL.format(cover_id=cover_id)
+            async with session.head(cover_url, allow_redirects=True) as response:
+                if response.status == 200:
+                    return cover_url
 
         except Exception as e:
             self.console.print(f"[red]OpenLibrary API error: {str(e)}[/red]")
         return None
 
+    async def _find_cover_url(self, session: aiohttp.ClientSession,
+                              title: str, author: str) -> Optional[str]:
+        """Query Google Books and OpenLibrary at once; the first cover URL found wins."""
+        encoded = _encode_query(title, author)
+        tasks = [
+            asyncio.create_task(source(session, title, author, encoded))
+            for source in (self.try_google_books, self.try_openlibrary)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                if cover_url := await next_done:
+                    return cover_url
+            return None
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def analyze_cover_changes(self, books: List[Book], progress, task) -> List[Tuple]:
         """Analyze what cover changes would be made"""
         changes = []
-        async with aiohttp.ClientSession() as session:
-            for book in books:
-                progress.update(task, advance=1)
-                current_status = "Has cover" if book.cover else "No cover"  # Changed from has_cover to cover
-                
-                # Check if we can get a new cover
-                cover_url = None
-                for source in [self.try_google_books, self.try_openlibrary]:
-                    author = f"{book.author_name_first or ''} {book.author_name_second or ''}".strip()
-                    cover_url = await source(session, book.title, author)
-                    if cover_url:
-                        break
+        session = await self._session()
+
+        async def find_cover(book):
+            return await self._find_cover_url(session, book.title, book.full_author)
+
+        cover_urls = await self._gather_books(books, find_cover, progress, task)
+
+        for book, cover_url in zip(books, cover_urls):
+            current_status = "Has cover" if book.cover else "No cover"  # Changed from has_cover to cover
                 
-                if cover_url:
-                    proposed = "Update cover" if book.cover else "Add new cover"  # Changed from has_cover to cover
-                    changes.append((book.id, book.title, current_status, proposed))
-                elif not book.cover:  # Changed from has_cover to cover
-                    changes.append((book.id, book.title, current_status, "No cover found"))
+            if cover_url:
+                proposed = "Update cover" if book.cover else "Add new cover"  # Changed from has_cover to cover
+                changes.append((book.id, book.title, current_status, proposed))
+            elif not book.cover:  # Changed from has_cover to cover
+                changes.append((book.id, book.title, current_status, "No cover found"))
 
         return changes
 
@@ -209,18 +479,11 @@ class MetadataFetcher:
             table.add_column("Proposed Change", style="green")
             
             for book_id, title, current, proposed in self.proposed_changes[change_type]:
-                status_style = "red" if current == "No cover" else "yellow"
-                proposed_style = {
-                    "Add new cover": "bold green",
-                    "Update cover": "bold yellow",
-                    "No cover found": "bold red"
-                }.get(proposed, "white")
-                
                 table.add_row(
                     str(book_id),
-                    title,
-                    f"[{status_style}]{current}[/{status_style}]",
-                    f"[{proposed_style}]{proposed}[/{proposed_style}]"
+                    Text(title),
+                    Text(current, style=_RED if current == "No cover" else _YELLOW),
+                    Text(proposed, style=_PROPOSED_COVER_STYLES.get(proposed, _WHITE))
                 )
         else:
             table.add_column("Book ID", justify="right", style="dim cyan")
@@ -229,12 +492,11 @@ class MetadataFetcher:
             table.add_column("New Value", style="green")
             
             for book_id, title, current, proposed in self.proposed_changes[change_type]:
-                current_display = str(current) if current else "[italic red]None[/italic red]"
                 table.add_row(
                     str(book_id),
-                    title,
-                    current_display,
-                    f"[bold green]{proposed}[/bold green]"
+                    Text(title),
+                    Text(str(current)) if current else Text("None", style=_ITALIC_RED),
+                    Text(str(proposed), style=_BOLD_GREEN)
                 )
 
         self.console.print("\n")
@@ -263,12 +525,12 @@ class MetadataFetcher:
 
     async def fetch_covers_async(self):
         """Fetch book covers asynchronously"""
-        with Progress() as progress:
+        with Progress(refresh_per_second=_PROGRESS_REFRESH_PER_SECOND) as progress:
             task1 = progress.add_task(
                 "[cyan]Analyzing current covers...", 
                 total=None
             )
-            books = self.get_books_needing_covers()
+            books = self.get_books_needing_metadata('covers')
             progress.update(task1, completed=True)
 
             task2 = progress.add_task(
@@ -289,31 +551,67 @@ class MetadataFetcher:
 
         # Proceed with actual fetching
         self.console.print("\n[bold cyan]Applying changes...[/bold cyan]")
-        async with aiohttp.ClientSession() as session:
-            with Progress() as progress:
-                task = progress.add_task(
-                    "[cyan]Downloading covers...", 
-                    total=len(books)
-                )
-                for book in books:
-                    progress.update(task, advance=1)
-                    
-                    # Try Google Books first
-                    if cover_url := await self.try_google_books(session, book.title, book.author_name_first):
-                        # Save cover logic here
-                        self.results['covers']['success'] += 1
-                        continue
-                        
-                    # Try OpenLibrary as fallback
-                    if cover_url := await self.try_openlibrary(session, book.title, book.author_name_first):
-                        # Save cover logic here
-                        self.results['covers']['success'] += 1
-                        continue
+        session = await self._session()
+        with Progress(refresh_per_second=_PROGRESS_REFRESH_PER_SECOND) as progress:
+            task = progress.add_task(
+                "[cyan]Downloading covers...", 
+                total=len(books)
+            )
+
+            async def fetch_cover(book):
+                cover_url = await self._find_cover_url(session, book.title, book.full_author)
+                return bool(cover_url) and await self._save_cover(session, cover_url, book.id)
+
+            saved = await self._gather_books(books, fetch_cover, progress, task)
+
+            for book, ok in zip(books, saved):
+                if ok:
+                    self.results['covers']['updated' if book.cover else 'success'] += 1
+                    book.cover = True
+                    continue
                         
-                    self.results['covers']['failed'].append(f"{book.title} by {book.author_name_first}")
+                self.results['covers']['failed'].append(f"{book.title} by {book.full_author}")
+
+        self.session.commit()
+
+    async def _save_cover(self, session: aiohttp.ClientSession, url: str, book_id: int) -> bool:
+        """Download a cover to <id>.jpg if it has book-cover proportions."""
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return False
+
+                # Dimensions come from the image header in the first few KB; a cover with
+                # the wrong shape is abandoned there instead of being downloaded in full
+                header = bytearray()
+                size = None
+                async for chunk in response.content.iter_chunked(_HEADER_CHUNK_BYTES):
+                    header += chunk
+                    size = _image_size(header)
+                    if size is not None or len(header) >= _MAX_HEADER_BYTES:
+                        break
+                if size is None or not self._has_cover_proportions(*size):
+                    return False
+
+                body = header
+                async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_BYTES):
+                    body += chunk
+
+            # File writes go to the default thread pool so the other downloads keep going meanwhile
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _write_atomic, self.assets_path / f"{book_id}.jpg", bytes(body))
+            return True
+        except Exception as e:
+            self.console.print(f"[red]Error saving cover for book {book_id}: {str(e)}[/red]")
+            return False
 
     def fetch_all_metadata(self):
         """Fetch all available metadata"""
+        # One loop run for every phase, instead of one per metadata type
+        self._run(self._fetch_all_metadata())
+
+    async def _fetch_all_metadata(self):
+        """Analyze and apply every metadata type, sharing one HTTP session."""
         self.console.print(Panel(
             "[bold white]Starting comprehensive metadata analysis...[/bold white]",
             title="[bold blue]Metadata Update[/bold blue]",
@@ -334,15 +632,19 @@ class MetadataFetcher:
                 
             # Proceed with the actual fetching for this type
             if metadata_type == 'covers':
-                self.fetch_covers()
+                await self._covers_phase()
             elif metadata_type == 'isbn':
-                self.fetch_isbns()
+                await self._isbns_phase()
             # ... (other metadata types) ...
 
     def fetch_covers(self):
         """Fetch book covers"""
+        self._run(self._covers_phase())
+
+    async def _covers_phase(self):
+        """Fetch covers and print the cover report."""
         self.console.print("[bold blue]Fetching book covers...[/bold blue]")
-        asyncio.run(self.fetch_covers_async())
+        await self.fetch_covers_async()
         self.print_cover_report()
 
     def print_cover_report(self):
@@ -358,105 +660,127 @@ class MetadataFetcher:
 
     def fetch_isbns(self):
         """Fetch ISBN numbers"""
+        self._run(self._isbns_phase())
+
+    async def _isbns_phase(self):
+        """Fetch ISBNs into the isbn table."""
         self.console.print("[bold blue]Fetching ISBN numbers...[/bold blue]")
-        asyncio.run(self.fetch_isbns_async())
+        await self.fetch_isbns_async()
 
-    async def try_fetch_isbn(self, session: aiohttp.ClientSession, title: str, author: str) -> Dict[str, str]:
+    async def try_fetch_isbn(self, session: aiohttp.ClientSession, encoded: Tuple[str, str, str]) -> Dict[str, str]:
         """Try to fetch ISBNs from various sources"""
+        query, clean_title, clean_author = encoded
         try:
             # Try Google Books first
-            query = quote(f"intitle:\"{title}\" inauthor:\"{author}\"")
-            async with session.get(f"{self.google_books_url}?q={query}&maxResults=1") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if 'items' in data:
-                        volume_info = data['items'][0]['volumeInfo']
-                        identifiers = volume_info.get('industryIdentifiers', [])
-                        result = {
-                            'isbn_10': None,
-                            'isbn_13': None,
-                            'asin': None,
-                            'source': 'google_books'
-                        }
-                        for identifier in identifiers:
-                            if identifier['type'] == 'ISBN_10':
-                                result['isbn_10'] = identifier['identifier']
-                            elif identifier['type'] == 'ISBN_13':
-                                result['isbn_13'] = identifier['identifier']
-                        return result
+            data = await self._get_json(
+                session, f"{self.google_books_url}?q={query}&maxResults=1&fields={_GOOGLE_ISBN_FIELDS}"
+            )
+            if data is not None and 'items' in data:
+                volume_info = data['items'][0].get('volumeInfo', {})
+                identifiers = volume_info.get('industryIdentifiers', [])
+                result = {
+                    'isbn_10': None,
+                    'isbn_13': None,
+                    'asin': None,
+                    'source': 'google_books'
+                }
+                for identifier in identifiers:
+                    if identifier['type'] == 'ISBN_10':
+                        result['isbn_10'] = identifier['identifier']
+                    elif identifier['type'] == 'ISBN_13':
+                        result['isbn_13'] = identifier['identifier']
+                return result
 
             # Try OpenLibrary as fallback
-            clean_title = quote(title.lower().replace(' ', '+'))
-            clean_author = quote(author.lower().replace(' ', '+'))
-            async with session.get(f"{self.openlibrary_url}?title={clean_title}&author={clean_author}") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if data.get('docs'):
-                        doc = data['docs'][0]
-                        return {
-                            'isbn_10': doc.get('isbn', [None])[0],
-                            'isbn_13': doc.get('isbn13', [None])[0],
-                            'asin': None,
-                            'source': 'openlibrary'
-                        }
+            data = await self._get_json(
+                session, f"{self.openlibrary_url}?title={clean_title}&author={clean_author}&fields=isbn"
+            )
+            if data is not None and data.get('docs'):
+                doc = data['docs'][0]
+                return {
+                    'isbn_10': doc.get('isbn', [None])[0],
+                    'isbn_13': doc.get('isbn13', [None])[0],
+                    'asin': None,
+                    'source': 'openlibrary'
+                }
 
         except Exception as e:
             self.console.print(f"[red]Error fetching ISBN: {str(e)}[/red]")
         
         return {}
 
+    def _existing_isbn_keys(self, column, values) -> set:
+        """Keys of the given identifier values that are already in the isbn table."""
+        values = {value for value in values if value}
+        if not values:
+            return set()
+        rows = self.session.query(column).filter(column.in_(values))
+        return {_isbn_key(value) for (value,) in rows}
+
     async def fetch_isbns_async(self):
         """Fetch ISBNs for books and store them in the isbn table without modifying books"""
-        query = self.session.query(Book)
-        books = query.all()
+        # Just the columns copied into ISBN records, not full Book objects
+        books = self.session.query(
+            Book.id,
+            Book.title,
+            Book.author_name_first,
+            Book.author_name_second,
+            Book.author_gender,
+            Book.page_count,
+            Book.date_published,
+            Book.full_author.label('full_author')
+        ).all()
         
         if not books:
             self.console.print("[green]No books found![/green]")
             return
 
-        async with aiohttp.ClientSession() as session:
-            with Progress() as progress:
-                task = progress.add_task("[cyan]Fetching ISBNs...", total=len(books))
+        session = await self._session()
+        with Progress(refresh_per_second=_PROGRESS_REFRESH_PER_SECOND) as progress:
+            task = progress.add_task("[cyan]Fetching ISBNs...", total=len(books))
 
-                for book in books:
-                    author = f"{book.author_name_first or ''} {book.author_name_second or ''}".strip()
-                    isbns = await self.try_fetch_isbn(session, book.title, author)
-                    
-                    if isbns.get('isbn_10') or isbns.get('isbn_13') or isbns.get('asin'):
-                        # Check if any of these ISBNs already exist
-                        existing_isbn = None
-                        if isbns.get('isbn_10'):
-                            existing_isbn = self.session.query(ISBN).filter_by(isbn_10=isbns['isbn_10']).first()
-                        if not existing_isbn and isbns.get('isbn_13'):
-                            existing_isbn = self.session.query(ISBN).filter_by(isbn_13=isbns['isbn_13']).first()
-                        if not existing_isbn and isbns.get('asin'):
-                            existing_isbn = self.session.query(ISBN).filter_by(asin=isbns['asin']).first()
-
-                        if existing_isbn:
-                            self.results['isbn']['skipped'] += 1
-                        else:
-                            # Create new ISBN record
-                            isbn_record = ISBN(
-                                title=book.title,
-                                author_name_first=book.author_name_first,
-                                author_name_second=book.author_name_second,
-                                author_gender=book.author_gender,
-                                page_count=book.page_count,
-                                date_published=book.date_published,
-                                has_cover=book.has_cover,
-                                isbn_10=isbns.get('isbn_10'),
-                                isbn_13=isbns.get('isbn_13'),
-                                asin=isbns.get('asin'),
-                                source=isbns.get('source')
-                            )
-                            self.session.add(isbn_record)
-                            self.results['isbn']['success'] += 1
+            async def fetch_isbn(book):
+                return await self.try_fetch_isbn(session, _encode_query(book.title, book.full_author))
+
+            # Network lookups run concurrently; the duplicate checks and inserts stay in book order
+            all_isbns = await self._gather_books(books, fetch_isbn, progress, task)
+
+            # One IN query per identifier column instead of up to three lookups per book
+            existing = {
+                key: self._existing_isbn_keys(column, [isbns.get(key) for isbns in all_isbns])
+                for key, column in (('isbn_10', ISBN.isbn_10), ('isbn_13', ISBN.isbn_13), ('asin', ISBN.asin))
+            }
+
+            new_records = []
+            for book, isbns in zip(books, all_isbns):
+                if isbns.get('isbn_10') or isbns.get('isbn_13') or isbns.get('asin'):
+                    # Check if any of these ISBNs already exist
+                    if any(isbns.get(key) and _isbn_key(isbns[key]) in keys for key, keys in existing.items()):
+                        self.results['isbn']['skipped'] += 1
                     else:
-                        self.results['isbn']['failed'].append((book.id, book.title, author))
+                        # Create new ISBN record
+                        new_records.append(ISBN(
+                            title=book.title,
+                            author_name_first=book.author_name_first,
+                            author_name_second=book.author_name_second,
+                            author_gender=book.author_gender,
+                            page_count=book.page_count,
+                            date_published=book.date_published,
+                            isbn_10=isbns.get('isbn_10'),
+                            isbn_13=isbns.get('isbn_13'),
+                            asin=isbns.get('asin'),
+                            source=isbns.get('source')
+                        ))
+                        # Later books in this run must see it as existing too
+                        for key, keys in existing.items():
+                            if isbns.get(key):
+                                keys.add(_isbn_key(isbns[key]))
+                        self.results['isbn']['success'] += 1
+                else:
+                    self.results['isbn']['failed'].append((book.id, book.title, book.full_author))
                     
-                    progress.advance(task)
-                    
-                self.session.commit()
+            self.session.bulk_save_objects(new_records)
+            self.session.commit()
 
         # Print results
         stats_table = Table(
@@ -496,20 +820,18 @@ class MetadataFetcher:
             self.console.print("\n")
             self.console.print(failed_table)
 
-    async def try_fetch_page_count(self, session: aiohttp.ClientSession, title: str, author: str) -> Optional[int]:
+    async def try_fetch_page_count(self, session: aiohttp.ClientSession, encoded: Tuple[str, str, str]) -> Optional[int]:
         """Try to fetch page count from Google Books API"""
         try:
-            query = quote(f"intitle:\"{title}\" inauthor:\"{author}\"")
-            async with session.get(f"{self.google_books_url}?q={query}&maxResults=1") as response:
-                if response.status != 200:
-                    return None
-
-                data = await response.json()
-                if 'items' not in data:
-                    return None
+            query = encoded[0]
+            data = await self._get_json(
+                session, f"{self.google_books_url}?q={query}&maxResults=1&fields={_GOOGLE_PAGES_FIELDS}"
+            )
+            if data is None or 'items' not in data:
+                return None
 
-                volume_info = data['items'][0]['volumeInfo']
-                return volume_info.get('pageCount')
+            volume_info = data['items'][0].get('volumeInfo', {})
+            return volume_info.get('pageCount')
 
         except Exception as e:
             self.console.print(f"[red]Error fetching page count: {str(e)}[/red]")
@@ -523,21 +845,23 @@ class MetadataFetcher:
             self.console.print("[yellow]No books found needing page count updates.[/yellow]")
             return
 
-        async with aiohttp.ClientSession() as session:
-            with Progress() as progress:
-                task = progress.add_task("[cyan]Fetching page counts...", total=len(books))
+        session = await self._session()
+        with Progress(refresh_per_second=_PROGRESS_REFRESH_PER_SECOND) as progress:
+            task = progress.add_task("[cyan]Fetching page counts...", total=len(books))
 
-                for book in books:
-                    author = f"{book.author_name_first or ''} {book.author_name_second or ''}".strip()
-                    if page_count := await self.try_fetch_page_count(session, book.title, author):
-                        book.page_count = page_count
-                        self.results['pages']['success'] += 1
-                    else:
-                        self.results['pages']['failed'].append(f"{book.title} by {author}")
-                    
-                    progress.advance(task)
+            async def fetch_page_count(book):
+                return await self.try_fetch_page_count(session, _encode_query(book.title, book.full_author))
 
-            self.session.commit()
+            page_counts = await self._gather_books(books, fetch_page_count, progress, task)
+
+            for book, page_count in zip(books, page_counts):
+                if page_count:
+                    book.page_count = page_count
+                    self.results['pages']['success'] += 1
+                else:
+                    self.results['pages']['failed'].append(f"{book.title} by {book.full_author}")
+
+        self.session.commit()
 
         # Print results
         self.console.print("\n[bold green]Page Count Fetching Report:[/bold green]")
@@ -550,4 +874,4 @@ class MetadataFetcher:
     def fetch_page_counts(self):
         """Fetch page counts for books"""
         self.console.print("[bold blue]Fetching page counts...[/bold blue]")
-        asyncio.run(self.fetch_page_counts_async())
+        self._run(self.fetch_page_counts_async())
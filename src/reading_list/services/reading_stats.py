@@ -24,12 +24,12 @@ class ReadingStatsService:
         table.add_column("Total Readings", justify="right", style="blue")
         table.add_column("Completed", justify="right", style="purple")
         
+        # Keys as returned by get_books_by_author; counts stay numeric there for the CLI filters
         for stat in stats:
-            table.add_row(
-                stat['author'],
-                str(stat['total_books']),
-                str(stat['total_readings']),
-                str(stat['completed_readings'])
-            )
+            table.add_row(stat['author'], *map(str, (
+                stat['total_books_owned'],
+                stat['total_reading_sessions'],
+                stat['unique_books_completed']
+            )))
         
         self.console.print(table)
\ No newline at end of file
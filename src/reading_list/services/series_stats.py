@@ -2,22 +2,166 @@
 from datetime import datetime
 import csv
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Tuple
 from rich.console import Console
 from rich.table import Table, Column
 from rich.style import Style
 from rich.box import SIMPLE_HEAD
 from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
 from ..models.base import engine
 from ..queries.common_queries import CommonQueries
 
 console = Console()
 
+# Spellings of the same author that appear across books, keyed by lowercase name
+_AUTHOR_ALIASES = {
+    'sue lynn tan': 'Sue Lynn Tan',
+    'evan winter': 'Evan Winter',
+    'evan winters': 'Evan Winter',
+    've schwab': 'VE Schwab',
+}
+
+def _canonicalize_authors(authors: str) -> str:
+    """Collapse a GROUP_CONCAT author list to one sorted, canonical spelling per author."""
+    seen = {}
+    for name in (authors or "").split(','):
+        name = name.strip()
+        if name:
+            key = name.lower()
+            canonical = _AUTHOR_ALIASES.get(key, name)
+            seen.setdefault(canonical.lower(), canonical)
+    return ','.join(seen[key] for key in sorted(seen))
+
+# Which reads count towards the report, for each reporting mode
+_BASE_CONDITIONS = {
+    'all': "1=1",  # Always true
+    'finished': "r.date_finished_actual IS NOT NULL",
+    'upcoming': "r.date_finished_actual IS NULL AND r.date_est_start IS NOT NULL AND r.date_est_end IS NOT NULL",
+}
+
+_SERIES_SQL = """
+    WITH series_authors AS (
+        SELECT
+            series,
+            GROUP_CONCAT(DISTINCT TRIM(COALESCE(author_name_first, '') || ' ' || COALESCE(author_name_second, ''))) as authors
+        FROM books
+        WHERE series IS NOT NULL
+        GROUP BY series
+    ),
+    -- One row per book: the reads counted for this report, and finished reads overall
+    book_reads AS (
+        SELECT
+            r.book_id,
+            SUM(CASE
+                WHEN {base_condition} AND (r.reread IS NULL OR r.reread = 0)
+                THEN 1
+                ELSE 0
+            END) as counted_reads,
+            SUM(CASE
+                WHEN r.date_finished_actual IS NOT NULL
+                THEN 1
+                ELSE 0
+            END) as finished_reads
+        FROM read r
+        GROUP BY r.book_id
+    ),
+    series_books AS (
+        SELECT
+            b.series,
+            b.id,
+            b.word_count,
+            b.word_count >= 45000 as is_novel,
+            b.word_count < 45000 as is_novella,
+            COALESCE(br.counted_reads, 0) as counted_reads,
+            COALESCE(br.finished_reads, 0) as finished_reads,
+            (b.date_published IS NULL OR b.date_published > DATE('now')) as is_future
+        FROM books b
+        LEFT JOIN book_reads br ON br.book_id = b.id
+        WHERE b.series IS NOT NULL
+    )
+    -- Read, total, future and unread figures for every series in one pass over books
+    SELECT
+        sb.series,
+        SUM(sb.counted_reads > 0) as book_count,
+        SUM(DISTINCT CASE WHEN sb.counted_reads > 0 THEN sb.word_count END) as total_words,
+        sa.authors,
+        SUM(CASE WHEN sb.is_novel THEN sb.counted_reads ELSE 0 END) as novel_count,
+        SUM(CASE WHEN sb.is_novella THEN sb.counted_reads ELSE 0 END) as novella_count,
+        COUNT(*) as total_book_count,
+        SUM(CASE WHEN sb.is_novel THEN 1 ELSE 0 END) as total_novel_count,
+        SUM(CASE WHEN sb.is_novella THEN 1 ELSE 0 END) as total_novella_count,
+        SUM(sb.finished_reads) as read_count,
+        SUM(CASE WHEN sb.finished_reads = 0 AND sb.is_future THEN 1 ELSE 0 END) as future_book_count,
+        SUM(CASE WHEN sb.finished_reads = 0 AND sb.is_future AND sb.is_novel THEN 1 ELSE 0 END) as future_novel_count,
+        SUM(CASE WHEN sb.finished_reads = 0 AND sb.is_future AND sb.is_novella THEN 1 ELSE 0 END) as future_novella_count,
+        COALESCE(SUM(CASE WHEN sb.finished_reads = 0 THEN sb.word_count END), 0) as unread_words
+    FROM series_books sb
+    LEFT JOIN series_authors sa ON sa.series = sb.series
+    GROUP BY sb.series
+    HAVING SUM(sb.counted_reads) > 0
+    ORDER BY total_words DESC, sb.series
+"""
+
+_STANDALONE_SQL = """
+    SELECT
+        b.title,
+        COALESCE(b.author_name_first || ' ' || b.author_name_second, '') as author,
+        b.word_count
+    FROM books b
+    JOIN read r ON r.book_id = b.id
+    WHERE b.series IS NULL
+    AND {base_condition}
+    AND (r.reread IS NULL OR r.reread = 0)
+    GROUP BY b.id
+    ORDER BY b.word_count DESC, b.title
+"""
+
+# Built once per mode at import so each run reuses the same statements
+_QUERIES = {
+    mode: {
+        "series": text(_SERIES_SQL.format(base_condition=condition)),
+        "standalone": text(_STANDALONE_SQL.format(base_condition=condition)),
+    }
+    for mode, condition in _BASE_CONDITIONS.items()
+}
+
+def _build_reread_rows(reread_results, upcoming: bool) -> Tuple[List[Tuple], int, int]:
+    """Shape reread results into table rows, totalling the additional reads and words as we go."""
+    rows = []
+    books_total = 0
+    words_total = 0
+    for reading in reread_results:
+        if upcoming:
+            book = reading.book
+            times_read = 2  # For upcoming, it's always 2 (1 previous + 1 upcoming)
+            additional_words = book.word_count  # For upcoming, additional words is just the word count once
+        else:
+            book = reading[0].book
+            times_read = reading[1]
+            additional_words = book.word_count * (times_read - 1)  # Additional words from rereads
+        rows.append((
+            book.title,
+            f"{book.author_name_first} {book.author_name_second}".strip(),
+            times_read,
+            book.word_count,
+            additional_words
+        ))
+        # Only reads beyond the first count here; the first is in series or standalone
+        books_total += times_read - 1
+        words_total += additional_words or 0
+    return rows, books_total, words_total
+
+# Thousands-separator formatter, bound once for the table loops
+_COMMA = "{:,}".format
+
+# CSV exports are written through a large buffer rather than the default 8 KB
+_CSV_BUFFER_BYTES = 1024 * 1024
+
 class SeriesStatsService:
     """Service for generating and displaying series statistics."""
 
     def __init__(self):
-        self.console = Console()
         # Define styles
         self.styles = {
             'header': Style(color="magenta", bold=True),
@@ -29,142 +173,20 @@ class SeriesStatsService:
             'title': Style(color="blue", bold=True),
         }
 
-    def _get_queries(self, finished_only: bool = False, upcoming: bool = False) -> dict[str, str]:
+    def _get_queries(self, finished_only: bool = False, upcoming: bool = False) -> Dict[str, TextClause]:
         """Get SQL queries for statistics."""
         if upcoming:
-            base_condition = "r.date_finished_actual IS NULL AND r.date_est_start IS NOT NULL AND r.date_est_end IS NOT NULL"
-        elif finished_only:
-            base_condition = "r.date_finished_actual IS NOT NULL"
-        else:
-            base_condition = "1=1"  # Always true
-
-        return {
-            "series": f"""
-                SELECT
-                    b.series,
-                    COUNT(DISTINCT b.id) as book_count,
-                    SUM(DISTINCT b.word_count) as total_words,
-                    (SELECT GROUP_CONCAT(DISTINCT author) FROM (
-                        SELECT DISTINCT
-                            CASE
-                                WHEN b2.author_name_first = 'Sue' AND b2.author_name_second = 'Lynn Tan'
-                                THEN 'Sue Lynn Tan'
-                                WHEN b2.author_name_first = 'Evan' AND (b2.author_name_second = 'Winter' OR b2.author_name_second = 'Winters')
-                                THEN 'Evan Winter'
-                                WHEN b2.author_name_first = 'VE' OR b2.author_name_first = 'Ve'
-                                THEN 'VE Schwab'
-                                ELSE COALESCE(b2.author_name_first || ' ' || b2.author_name_second, '')
-                            END as author
-                        FROM books b2
-                        WHERE b2.series = b.series
-                        GROUP BY
-                            CASE
-                                WHEN LOWER(b2.author_name_first) IN ('sue', 've', 'evan')
-                                THEN LOWER(b2.author_name_first)
-                                ELSE LOWER(TRIM(COALESCE(b2.author_name_first, '') || ' ' || COALESCE(b2.author_name_second, '')))
-                            END
-                    )) as authors,
-                    SUM(CASE
-                        WHEN b.word_count >= 45000
-                        THEN 1
-                        ELSE 0
-                    END) as novel_count,
-                    SUM(CASE
-                        WHEN b.word_count < 45000
-                        THEN 1
-                        ELSE 0
-                    END) as novella_count
-                FROM books b
-                JOIN read r ON r.book_id = b.id
-                WHERE b.series IS NOT NULL
-                AND {base_condition}
-                AND (r.reread IS NULL OR r.reread = 0)
-                GROUP BY b.series
-                ORDER BY total_words DESC
-            """,
-            "series_total": """
-                SELECT
-                    b.series,
-                    COUNT(DISTINCT b.id) as total_book_count,
-                    SUM(CASE
-                        WHEN b.word_count >= 45000
-                        THEN 1
-                        ELSE 0
-                    END) as total_novel_count,
-                    SUM(CASE
-                        WHEN b.word_count < 45000
-                        THEN 1
-                        ELSE 0
-                    END) as total_novella_count,
-                    (SELECT COUNT(*) FROM read r WHERE r.book_id IN (SELECT id FROM books WHERE series = b.series) AND r.date_finished_actual IS NOT NULL) as read_count
-                FROM books b
-                WHERE b.series IS NOT NULL
-                GROUP BY b.series
-            """,
-            "future_books": """
-                SELECT
-                    b.series,
-                    COUNT(DISTINCT b.id) as future_book_count,
-                    SUM(CASE
-                        WHEN b.word_count >= 45000
-                        THEN 1
-                        ELSE 0
-                    END) as future_novel_count,
-                    SUM(CASE
-                        WHEN b.word_count < 45000
-                        THEN 1
-                        ELSE 0
-                    END) as future_novella_count,
-                    SUM(b.word_count) as future_words
-                FROM books b
-                LEFT JOIN read r ON b.id = r.book_id AND r.date_finished_actual IS NOT NULL
-                WHERE b.series IS NOT NULL
-                AND r.id IS NULL  -- Only include books that haven't been read
-                AND (b.date_published IS NULL OR b.date_published > DATE('now'))
-                GROUP BY b.series
-            """,
-            "unread_books": """
-                SELECT
-                    b.series,
-                    COUNT(DISTINCT b.id) as unread_book_count,
-                    SUM(CASE
-                        WHEN b.word_count >= 45000
-                        THEN 1
-                        ELSE 0
-                    END) as unread_novel_count,
-                    SUM(CASE
-                        WHEN b.word_count < 45000
-                        THEN 1
-                        ELSE 0
-                    END) as unread_novella_count,
-                    SUM(b.word_count) as unread_words
-                FROM books b
-                LEFT JOIN read r ON b.id = r.book_id AND r.date_finished_actual IS NOT NULL
-                WHERE b.series IS NOT NULL
-                AND r.id IS NULL  -- Only include books that haven't been read
-                GROUP BY b.series
-            """,
-            "standalone": f"""
-                SELECT
-                    b.title,
-                    COALESCE(b.author_name_first || ' ' || b.author_name_second, '') as author,
-                    b.word_count
-                FROM books b
-                JOIN read r ON r.book_id = b.id
-                WHERE b.series IS NULL
-                AND {base_condition}
-                AND (r.reread IS NULL OR r.reread = 0)
-                GROUP BY b.id
-                ORDER BY b.word_count DESC
-            """
-        }
+            return _QUERIES['upcoming']
+        if finished_only:
+            return _QUERIES['finished']
+        return _QUERIES['all']
 
     def _format_number(self, number: int) -> str:
         """Format a number with commas and color."""
-        return f"[green]{number:,}[/green]"
+        return f"[green]{_COMMA(number)}[/green]"
 
-    def _create_series_table(self, results: List[Tuple], total_counts: List[Tuple], future_counts: List[Tuple], unread_counts: List[Tuple]) -> Table:
-        """Create a table for series statistics."""
+    def _create_series_table(self, results: Iterable[Tuple]) -> Tuple[Table, int, int]:
+        """Create a table for series statistics, returning it with the read books and words totals."""
         # Create a table with two header rows
         table = Table(
             title="📚 Series Statistics",
@@ -177,12 +199,9 @@ class SeriesStatsService:
             box=SIMPLE_HEAD
         )
 
-        # Compute a minimum width for the Author(s) column to fit the longest name
-        max_author_len = max((len((row[3] or "")) for row in results), default=10)
-
         # Add columns with empty headers (we'll add the actual headers in the first row)
         table.add_column(header="", justify="left", style="cyan", no_wrap=True)  # Series Name
-        table.add_column(header="", justify="left", style="blue", no_wrap=True, min_width=max_author_len)  # Author(s)
+        table.add_column(header="", justify="left", style="blue", no_wrap=True)  # Author(s)
 
         # Novels columns
         table.add_column(header="", justify="right", style="green")  # Read
@@ -230,32 +249,31 @@ class SeriesStatsService:
         total_all_books = 0
         total_read_words = 0
         total_unread_words = 0
-
-        # We'll use direct lookups with next() instead of dictionaries
+        total_read_novels = 0
+        total_read_novellas = 0
+        total_unread_novels = 0
+        total_unread_novellas = 0
+        total_novels_all = 0
+        total_novellas_all = 0
+        max_author_len = 0
 
         for row in results:
-            series_name = row[0] or "N/A"
-            authors = row[3] or "[dim]Unknown[/dim]"
-            read_books = row[1]
-            read_words = row[2] or 0
-            read_novels = row[4] or 0
-            read_novellas = row[5] or 0
-
-            # Get total counts for this series
-            total_count_row = next((r for r in total_counts if r[0] == series_name), None)
-            total_books = total_count_row[1] if total_count_row else read_books
-            total_novels = total_count_row[2] if total_count_row else read_novels
-            total_novellas = total_count_row[3] if total_count_row else read_novellas
-
-            # Get the number of future/unpublished books in this series
-            future_count_row = next((r for r in future_counts if r[0] == series_name), None)
-            future_books = future_count_row[1] if future_count_row else 0
-            future_novels = future_count_row[2] if future_count_row else 0
-            future_novellas = future_count_row[3] if future_count_row else 0
-
-            # Get the unread books for this series
-            unread_count_row = next((r for r in unread_counts if r[0] == series_name), None)
-            unread_words = unread_count_row[4] if unread_count_row and len(unread_count_row) > 4 else 0
+            series_name = row.series or "N/A"
+            authors = _canonicalize_authors(row.authors)
+            max_author_len = max(max_author_len, len(authors))
+            read_books = row.book_count
+            read_words = row.total_words or 0
+            read_novels = row.novel_count or 0
+            read_novellas = row.novella_count or 0
+
+            # Total, future/unpublished and unread figures come back on the same row
+            total_books = row.total_book_count
+            total_novels = row.total_novel_count
+            total_novellas = row.total_novella_count
+            future_books = row.future_book_count
+            future_novels = row.future_novel_count
+            future_novellas = row.future_novella_count
+            unread_words = row.unread_words
 
             # Calculate unread books, excluding future/unpublished books
             # We don't want to count future/unpublished books as "unread"
@@ -268,10 +286,15 @@ class SeriesStatsService:
             total_all_books += total_books
             total_read_words += read_words
             total_unread_words += unread_words
+            total_read_novels += read_novels
+            total_read_novellas += read_novellas
+            total_unread_novels += unread_novels
+            total_unread_novellas += unread_novellas
+            total_novels_all += total_novels
+            total_novellas_all += total_novellas
 
             # Get the read count for this series
-            total_count_row = next((r for r in total_counts if r[0] == series_name), None)
-            read_count = total_count_row[4] if total_count_row and len(total_count_row) > 4 else 0
+            read_count = row.read_count
 
             # Color-code the series name based on status:
             # - Gray for series that haven't been started (no books read)
@@ -300,51 +323,20 @@ class SeriesStatsService:
 
             table.add_row(
                 series,
-                authors,
+                authors or "[dim]Unknown[/dim]",
                 str(read_novels),
                 "" if unread_novels == 0 else str(unread_novels),  # Show blank instead of 0
                 str(total_novels),
                 str(read_novellas),
                 "" if unread_novellas == 0 else str(unread_novellas),  # Show blank instead of 0
                 str(total_novellas),
-                f"{read_words:,}",
-                f"{unread_words:,}" if unread_words > 0 else "",  # Show blank instead of 0
-                f"{total_series_words:,}"
+                _COMMA(read_words),
+                _COMMA(unread_words) if unread_words > 0 else "",  # Show blank instead of 0
+                _COMMA(total_series_words)
             )
 
-        # Calculate totals for novels and novellas
-        total_read_novels = sum(row[4] or 0 for row in results)
-        total_read_novellas = sum(row[5] or 0 for row in results)
-
-        # Calculate total unread novels and novellas
-        total_unread_novels = 0
-        total_unread_novellas = 0
-        total_novels = 0
-        total_novellas = 0
-
-        for series_name in {row[0] for row in results}:
-            # Get total counts for this series
-            total_count_row = next((r for r in total_counts if r[0] == series_name), None)
-            if total_count_row:
-                total_novels += total_count_row[2] or 0
-                total_novellas += total_count_row[3] or 0
-
-            # Get future counts for this series
-            future_count_row = next((r for r in future_counts if r[0] == series_name), None)
-            future_novels = future_count_row[2] if future_count_row else 0
-            future_novellas = future_count_row[3] if future_count_row else 0
-
-            # Get read counts for this series
-            read_row = next((r for r in results if r[0] == series_name), None)
-            read_novels = read_row[4] if read_row else 0
-            read_novellas = read_row[5] if read_row else 0
-
-            # Calculate unread counts
-            unread_novels = max(0, (total_count_row[2] or 0) - read_novels - future_novels)
-            unread_novellas = max(0, (total_count_row[3] or 0) - read_novellas - future_novellas)
-
-            total_unread_novels += unread_novels
-            total_unread_novellas += unread_novellas
+        # Rich measures columns at render time, so the width can be set once every row has streamed past
+        table.columns[1].min_width = max_author_len or 10
 
         # Calculate total words (read + unread)
         total_words = total_read_words + total_unread_words
@@ -353,19 +345,19 @@ class SeriesStatsService:
         table.add_row(
             "[bold white]TOTAL[/bold white]",
             "",
-            f"[bold green]{total_read_novels:,}[/bold green]",
-            f"[bold red]{total_unread_novels:,}[/bold red]" if total_unread_novels > 0 else "",
-            f"[bold blue]{total_novels:,}[/bold blue]",
-            f"[bold green]{total_read_novellas:,}[/bold green]",
-            f"[bold red]{total_unread_novellas:,}[/bold red]" if total_unread_novellas > 0 else "",
-            f"[bold blue]{total_novellas:,}[/bold blue]",
-            f"[bold green]{total_read_words:,}[/bold green]",
-            f"[bold red]{total_unread_words:,}[/bold red]" if total_unread_words > 0 else "",
-            f"[bold blue]{total_words:,}[/bold blue]",
+            f"[bold green]{_COMMA(total_read_novels)}[/bold green]",
+            f"[bold red]{_COMMA(total_unread_novels)}[/bold red]" if total_unread_novels > 0 else "",
+            f"[bold blue]{_COMMA(total_novels_all)}[/bold blue]",
+            f"[bold green]{_COMMA(total_read_novellas)}[/bold green]",
+            f"[bold red]{_COMMA(total_unread_novellas)}[/bold red]" if total_unread_novellas > 0 else "",
+            f"[bold blue]{_COMMA(total_novellas_all)}[/bold blue]",
+            f"[bold green]{_COMMA(total_read_words)}[/bold green]",
+            f"[bold red]{_COMMA(total_unread_words)}[/bold red]" if total_unread_words > 0 else "",
+            f"[bold blue]{_COMMA(total_words)}[/bold blue]",
             style="bold white"
         )
 
-        return table
+        return table, total_read_books, total_read_words
 
     def _create_standalone_table(self, results: List[Tuple]) -> Table:
         """Create a table for standalone book statistics."""
@@ -394,14 +386,14 @@ class SeriesStatsService:
             table.add_row(
                 title,
                 author,
-                f"{words:,}"
+                _COMMA(words)
             )
 
         # Add total row
         table.add_row(
             "[bold white]TOTAL[/bold white]",
             "",
-            f"[bold green]{total_words:,}[/bold green]",
+            f"[bold green]{_COMMA(total_words)}[/bold green]",
             style="bold white"
         )
 
@@ -453,8 +445,8 @@ class SeriesStatsService:
                 title,
                 author,
                 str(times_read),
-                f"{base_words:,}",
-                f"{additional_words:,}"
+                _COMMA(base_words),
+                _COMMA(additional_words)
             )
 
         # Add total row
@@ -462,15 +454,16 @@ class SeriesStatsService:
             "[bold white]TOTAL[/bold white]",
             "",
             # Show only additional reads in total (matches summary table)
-            f"[bold green]{total_rereads:,} (additional reads)[/bold green]",
-            f"[bold green]{total_base_words:,}[/bold green]",
-            f"[bold green]{total_additional_words:,}[/bold green]",
+            f"[bold green]{_COMMA(total_rereads)} (additional reads)[/bold green]",
+            f"[bold green]{_COMMA(total_base_words)}[/bold green]",
+            f"[bold green]{_COMMA(total_additional_words)}[/bold green]",
             style="bold white"
         )
 
         return table
 
-    def _create_summary_table(self, data: dict) -> Table:
+    def _create_summary_table(self, data: dict, series_books: int, series_words: int,
+                              reread_books: int, reread_words: int) -> Table:
         """Create a summary table with overall statistics."""
         table = Table(
             title="📊 Overall Reading Statistics",
@@ -487,19 +480,10 @@ class SeriesStatsService:
         table.add_column("Words", justify="right", style="green")
         table.add_column("Percentage", justify="right", style="yellow")
 
-        # Calculate totals
-        series_books = sum(row[1] for row in data['series'])
-        series_words = sum(row[2] or 0 for row in data['series'])
-
+        # Calculate totals; the series and reread figures are summed while building their rows
         standalone_books = len(data['standalone'])
         standalone_words = sum(row[2] or 0 for row in data['standalone'])
 
-        # For rereads, we only count the additional reads (beyond the first read)
-        # The first read is already counted in either series or standalone
-        reread_books = sum(row[2] - 1 for row in data['reread'])  # Subtract first read
-        # This is already just the additional words from rereads
-        reread_words = sum(row[4] or 0 for row in data['reread'])
-
         # The total should be the sum of all categories
         total_books = series_books + standalone_books + reread_books
         total_words = series_words + standalone_words + reread_words
@@ -514,22 +498,72 @@ class SeriesStatsService:
             percentage = (words / total_words * 100) if total_words > 0 else 0
             table.add_row(
                 category,
-                f"{books:,}",
-                f"{words:,}",
+                _COMMA(books),
+                _COMMA(words),
                 f"{percentage:.1f}%"
             )
 
         # Add total row
         table.add_row(
             "[bold white]TOTAL[/bold white]",
-            f"[bold green]{total_books:,}[/bold green]",
-            f"[bold green]{total_words:,}[/bold green]",
+            f"[bold green]{_COMMA(total_books)}[/bold green]",
+            f"[bold green]{_COMMA(total_words)}[/bold green]",
             "[bold yellow]100.0%[/bold yellow]",
             style="bold white"
         )
 
         return table
 
+    def _series_csv_rows(self, rows):
+        """Yield series.csv rows one at a time from the series query rows."""
+        for row in rows:
+            read_books = row.book_count
+            read_novels = row.novel_count
+            read_novellas = row.novella_count
+
+            # Total, future and unread counts come back on the same row
+            total_books = row.total_book_count
+            total_novels = row.total_novel_count
+            total_novellas = row.total_novella_count
+            future_books = row.future_book_count
+            future_novels = row.future_novel_count
+            future_novellas = row.future_novella_count
+            unread_words = row.unread_words
+
+            # Calculate unread books, excluding future/unpublished books
+            unread_books = max(0, total_books - read_books - future_books)
+            unread_novels = max(0, total_novels - read_novels - future_novels)
+            unread_novellas = max(0, total_novellas - read_novellas - future_novellas)
+
+            # Determine series status
+            if unread_books > 0:
+                status = "Unread Books"
+            elif future_books > 0:
+                status = "Future Books Only"
+            else:
+                status = "Complete"
+
+            # Calculate total words
+            read_words = row.total_words or 0
+            total_series_words = read_words + unread_words
+
+            yield (
+                row.series or "N/A",
+                _canonicalize_authors(row.authors) or "Unknown",
+                read_novels,
+                "" if unread_novels == 0 else unread_novels,
+                future_novels,
+                total_novels,
+                read_novellas,
+                "" if unread_novellas == 0 else unread_novellas,
+                future_novellas,
+                total_novellas,
+                read_words,
+                unread_words,
+                total_series_words,
+                status
+            )
+
     def _save_to_csv(self, data: dict, finished_only: bool) -> Path:
         """Save statistics to CSV files."""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -538,11 +572,9 @@ class SeriesStatsService:
         csv_dir = Path("csv") / f"series_stats_{status}_{timestamp}"
         csv_dir.mkdir(parents=True, exist_ok=True)
 
-        # We'll use direct lookups with next() instead of dictionaries
-
         # Save series data
         series_path = csv_dir / "series.csv"
-        with open(series_path, 'w', newline='', encoding='utf-8') as f:
+        with open(series_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_BYTES) as f:
             writer = csv.writer(f)
             writer.writerow([
                 'Series Name', 'Author(s)',
@@ -550,88 +582,27 @@ class SeriesStatsService:
                 'Novellas Read', 'Novellas Unread', 'Novellas Future', 'Novellas Total',
                 'Read Words', 'Unread Words', 'Total Words', 'Status'
             ])
-
-            for row in data['series']:
-                series = row[0] or "N/A"
-                read_books = row[1]
-                read_novels = row[4] if len(row) > 4 else 0
-                read_novellas = row[5] if len(row) > 5 else 0
-
-                # Get total counts for this series
-                total_count_row = next((r for r in data['series_total'] if r[0] == series), None)
-                total_books = total_count_row[1] if total_count_row else read_books
-                total_novels = total_count_row[2] if total_count_row and len(total_count_row) > 2 else read_novels
-                total_novellas = total_count_row[3] if total_count_row and len(total_count_row) > 3 else read_novellas
-
-                # Get future counts for this series
-                future_count_row = next((r for r in data['future_books'] if r[0] == series), None)
-                future_books = future_count_row[1] if future_count_row else 0
-                future_novels = future_count_row[2] if future_count_row and len(future_count_row) > 2 else 0
-                future_novellas = future_count_row[3] if future_count_row and len(future_count_row) > 3 else 0
-
-                # Get unread counts for this series
-                unread_count_row = next((r for r in data['unread_books'] if r[0] == series), None)
-                unread_words = unread_count_row[4] if unread_count_row and len(unread_count_row) > 4 else 0
-
-                # Calculate unread books, excluding future/unpublished books
-                unread_books = max(0, total_books - read_books - future_books)
-                unread_novels = max(0, total_novels - read_novels - future_novels)
-                unread_novellas = max(0, total_novellas - read_novellas - future_novellas)
-
-                # Determine series status
-                if unread_books > 0:
-                    status = "Unread Books"
-                elif future_books > 0:
-                    status = "Future Books Only"
-                else:
-                    status = "Complete"
-
-                # Calculate total words
-                read_words = row[2] or 0
-                total_series_words = read_words + unread_words
-
-                writer.writerow([
-                    series,
-                    row[3] or "Unknown",
-                    read_novels,
-                    "" if unread_novels == 0 else unread_novels,
-                    future_novels,
-                    total_novels,
-                    read_novellas,
-                    "" if unread_novellas == 0 else unread_novellas,
-                    future_novellas,
-                    total_novellas,
-                    read_words,
-                    unread_words,
-                    total_series_words,
-                    status
-                ])
+            writer.writerows(self._series_csv_rows(data['series']))
 
         # Save standalone data
         standalone_path = csv_dir / "standalone.csv"
-        with open(standalone_path, 'w', newline='', encoding='utf-8') as f:
+        with open(standalone_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_BYTES) as f:
             writer = csv.writer(f)
             writer.writerow(['Title', 'Author', 'Word Count'])
-            for row in data['standalone']:
-                writer.writerow([
-                    row[0] or "N/A",
-                    row[1] or "Unknown",
-                    row[2] or 0
-                ])
+            writer.writerows(
+                (row[0] or "N/A", row[1] or "Unknown", row[2] or 0)
+                for row in data['standalone']
+            )
 
         # Save reread data
         reread_path = csv_dir / "rereads.csv"
-        with open(reread_path, 'w', newline='', encoding='utf-8') as f:
+        with open(reread_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_BYTES) as f:
             writer = csv.writer(f)
             writer.writerow(['Title', 'Author', 'Times Read', 'Base Words', 'Additional Words'])
-            for row in data['reread']:
-                writer.writerow([
-                    row[0] or "N/A",
-                    row[1] or "Unknown",
-                    row[2],
-                    row[3] or 0,
-                    row[4] or 0
-                ])
+            writer.writerows(
+                (row[0] or "N/A", row[1] or "Unknown", row[2], row[3] or 0, row[4] or 0)
+                for row in data['reread']
+            )
 
         return csv_dir
 
@@ -646,10 +617,12 @@ class SeriesStatsService:
         """
         with engine.connect() as conn:
             queries = self._get_queries(finished_only, upcoming)
-            results = {
-                name: conn.execute(text(query)).fetchall()
-                for name, query in queries.items()
-            }
+            results = {'standalone': conn.execute(queries['standalone']).fetchall()}
+
+            # The series rows are streamed straight into the table unless the CSV export also needs them
+            results['series'] = conn.execute(queries['series'])
+            if csv_output:
+                results['series'] = results['series'].fetchall()
 
             # Get reread data using common query
             common_queries = CommonQueries()
@@ -657,29 +630,7 @@ class SeriesStatsService:
                 reread_type='upcoming' if upcoming else 'finished'
             )
 
-            # Transform reread results to match expected format
-            if upcoming:
-                results['reread'] = [
-                    (
-                        reading.book.title,
-                        f"{reading.book.author_name_first} {reading.book.author_name_second}".strip(),
-                        2,  # For upcoming, it's always 2 (1 previous + 1 upcoming)
-                        reading.book.word_count,
-                        reading.book.word_count  # For upcoming, additional words is just the word count once
-                    )
-                    for reading in reread_results
-                ]
-            else:
-                results['reread'] = [
-                    (
-                        reading[0].book.title,
-                        f"{reading[0].book.author_name_first} {reading[0].book.author_name_second}".strip(),
-                        reading[1],
-                        reading[0].book.word_count,
-                        reading[0].book.word_count * (reading[1] - 1)  # Additional words from rereads
-                    )
-                    for reading in reread_results
-                ]
+            results['reread'], reread_books, reread_words = _build_reread_rows(reread_results, upcoming)
 
             if csv_output:
                 output_dir = self._save_to_csv(results, finished_only)
@@ -700,11 +651,14 @@ class SeriesStatsService:
             console.print("[bold]Note:[/bold] Books are classified as novels if they are ≥45,000 words, otherwise they are considered novellas.")
             console.print("")
 
-            console.print(self._create_series_table(results['series'], results['series_total'], results['future_books'], results['unread_books']))
+            series_table, series_books, series_words = self._create_series_table(results['series'])
+            console.print(series_table)
             console.print("\n")
             console.print(self._create_standalone_table(results['standalone']))
             console.print("\n")
             console.print(self._create_reread_table(results['reread']))
             console.print("\n")
-            console.print(self._create_summary_table(results))
+            console.print(self._create_summary_table(
+                results, series_books, series_words, reread_books, reread_words
+            ))
             console.print("\n")
@@ -1,5 +1,6 @@
 """Service for displaying reading status information."""
 from datetime import datetime, timedelta, date
+from functools import lru_cache
 from typing import Optional, Dict
 
 from rich.console import Console
@@ -12,6 +13,38 @@ from ..utils.progress_calculator import calculate_reading_progress
 
 console = Console()
 
+# Badge (background, text) colors per media type
+_MEDIA_BADGE_COLORS = {
+    'kindle': ('#EFF6FF', '#0066CC'),    # Light blue bg, Deeper Kindle blue text
+    'ebook': ('#EFF6FF', '#0066CC'),     # Light blue bg, Deeper Kindle blue text
+    'hardcover': ('#F8F5FF', '#6B4BA3'), # Light purple bg, Space purple text
+    'audio': ('#FFF7ED', '#FF6600'),     # Light orange bg, Warmer Audible orange text
+    'audiobook': ('#FFF7ED', '#FF6600'), # Light orange bg, Warmer Audible orange text
+}
+_DEFAULT_BADGE_COLORS = ('#F3F4F6', '#4B5563')  # Light gray bg, gray text
+
+_MEDIA_COLORS = {
+    'hardcover': '#6B4BA3',  # Space purple
+    'audio': '#FF6600',      # Warmer Audible orange
+    'audiobook': '#FF6600',
+}
+_DEFAULT_MEDIA_COLOR = '#0066CC'  # Deeper Kindle blue
+
+@lru_cache(maxsize=None)
+def _media_badge_html(media: str) -> str:
+    """Build the HTML badge for a media type (only a handful of distinct values exist)."""
+    bg_color, text_color = _MEDIA_BADGE_COLORS.get(media.lower(), _DEFAULT_BADGE_COLORS)
+
+    return f"""<span style="
+            background-color: {bg_color};
+            color: {text_color};
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 12px;
+            font-weight: 600;
+            text-transform: capitalize;
+        ">{media}</span>"""
+
 class StatusDisplay:
     """Service for managing and displaying reading status information."""
 
@@ -44,12 +77,7 @@ class StatusDisplay:
 
     def get_media_color(self, media: str) -> str:
         """Get the color code for a media type."""
-        media = media.lower()
-        if media == 'hardcover':
-            return '#6B4BA3'  # Space purple
-        elif media in ['audio', 'audiobook']:
-            return '#FF6600'  # Warmer Audible orange
-        return '#0066CC'  # Deeper Kindle blue
+        return _MEDIA_COLORS.get(media.lower(), _DEFAULT_MEDIA_COLOR)
 
     def _format_author(self, book):
         """Format author name from book object."""
@@ -91,25 +119,7 @@ class StatusDisplay:
 
     def _format_media_badge(self, media: str) -> str:
         """Format media type as an HTML badge."""
-        media_colors = {
-            'kindle': ('#EFF6FF', '#0066CC'),    # Light blue bg, Deeper Kindle blue text
-            'ebook': ('#EFF6FF', '#0066CC'),     # Light blue bg, Deeper Kindle blue text
-            'hardcover': ('#F8F5FF', '#6B4BA3'), # Light purple bg, Space purple text
-            'audio': ('#FFF7ED', '#FF6600'),     # Light orange bg, Warmer Audible orange text
-            'audiobook': ('#FFF7ED', '#FF6600'), # Light orange bg, Warmer Audible orange text
-        }
-
-        bg_color, text_color = media_colors.get(media.lower(), ('#F3F4F6', '#4B5563'))  # Default: light gray bg, gray text
-
-        return f"""<span style="
-            background-color: {bg_color};
-            color: {text_color};
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 12px;
-            font-weight: 600;
-            text-transform: capitalize;
-        ">{media}</span>"""
+        return _media_badge_html(media)
 
     def show_current_readings(self):
         """Display currently active reading sessions."""
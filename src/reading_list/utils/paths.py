@@ -45,7 +45,8 @@ def get_project_paths() -> Dict[str, Path]:
         'assets': root / 'assets',
         'workspace': root,
         'database': root / 'data' / 'db' / 'reading_list.db',
-        'backups': root / 'data' / 'db' / 'backups'  # Updated path
+        'backups': root / 'data' / 'db' / 'backups',  # Updated path
+        'cache': root / 'data' / 'cache'
     }
 
 def ensure_paths_exist():
@@ -1,32 +1,34 @@
 """Utilities for calculating reading progress."""
 from datetime import date, timedelta
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
-def calculate_reading_progress(reading: Any, target_date: date) -> str:
+def calculate_reading_progress(reading: Any, target_date: date, raw_value: bool = False) -> Union[str, float]:
     """
     Calculate reading progress as a percentage.
     
     Args:
         reading: Reading object with start_date, end_date, and current_page
         target_date: Date to calculate progress for
+        raw_value: Return the rounded percentage as a float instead of a string
         
     Returns:
-        String representation of progress (e.g., "45%")
+        String representation of progress (e.g., "45%"), or 45.0 with raw_value
     """
     if not reading.date_started or not reading.date_est_end:
-        return "0%"
+        return 0.0 if raw_value else "0%"
 
     total_days = (reading.date_est_end - reading.date_started).days + 1
     days_elapsed = (target_date - reading.date_started).days + 1
     
     # Handle edge cases
-    if total_days <= 0:
-        return "0%"
-    if days_elapsed >= total_days:
-        return "100%"
-    if days_elapsed <= 0:
-        return "0%"
-    
-    # Calculate progress percentage
-    progress = (days_elapsed / total_days) * 100
-    return f"{int(round(progress))}%"
\ No newline at end of file
+    if total_days <= 0 or days_elapsed <= 0:
+        progress_value = 0
+    elif days_elapsed >= total_days:
+        progress_value = 100
+    else:
+        # Calculate progress percentage
+        progress_value = int(round((days_elapsed / total_days) * 100))
+
+    if raw_value:
+        return float(progress_value)
+    return f"{progress_value}%"
\ No newline at end of file
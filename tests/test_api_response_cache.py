@@ -0,0 +1,48 @@
+"""Tests for the on-disk API response cache used by the metadata fetcher."""
+import time
+
+from reading_list.services import metadata_fetcher
+from reading_list.services.metadata_fetcher import ApiResponseCache
+
+
+def test_get_returns_fresh_body(tmp_path):
+    cache = ApiResponseCache(tmp_path / "cache.sqlite", ttl_seconds=60)
+    try:
+        cache.put("https://example.org/a", b'{"a": 1}')
+        assert cache.get("https://example.org/a") == b'{"a": 1}'
+        assert cache.get("https://example.org/b") is None
+    finally:
+        cache.close()
+
+
+def test_evict_expired_removes_only_stale_rows(tmp_path):
+    cache = ApiResponseCache(tmp_path / "cache.sqlite", ttl_seconds=60)
+    try:
+        cache.put("https://example.org/old", b"old")
+        cache.put("https://example.org/new", b"new")
+        # Age one row past the TTL
+        with cache.conn:
+            cache.conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE key = ?",
+                (time.time() - 120, cache._key("https://example.org/old"))
+            )
+
+        assert cache.get("https://example.org/old") is None
+        assert cache.evict_expired() == 1
+        assert cache.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 1
+        assert cache.get("https://example.org/new") == b"new"
+    finally:
+        cache.close()
+
+
+def test_fetcher_close_is_idempotent(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        metadata_fetcher, "get_project_paths",
+        lambda: {'assets': tmp_path / 'assets', 'cache': tmp_path}
+    )
+    fetcher = metadata_fetcher.MetadataFetcher()
+    fetcher.api_cache.put("https://example.org/a", b"a")
+
+    fetcher.close()
+    fetcher.close()
+    assert fetcher.api_cache is None